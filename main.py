@@ -7,11 +7,6 @@ Run this script to start the server.
 """
 
 import sys
-from pathlib import Path
-
-# Add src to Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
 
 from macro_man.core.server import run_server
 
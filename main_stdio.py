@@ -6,13 +6,8 @@ This version uses stdio transport which is preferred by Claude Desktop.
 """
 
 import sys
-from pathlib import Path
 
-# Add src to Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
-from macro_man.core.server import create_mcp_server
+from macro_man.core.server import create_mcp_server, serve
 
 
 def main() -> None:
@@ -22,7 +17,7 @@ def main() -> None:
         mcp = create_mcp_server()
 
         # Run with stdio transport for Claude Desktop
-        mcp.run(transport="stdio")
+        serve(mcp, transport="stdio")
 
     except KeyboardInterrupt:
         print("Server shutdown requested by user", file=sys.stderr)
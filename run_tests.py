@@ -7,17 +7,26 @@ Run this script to execute all available tests.
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_command(cmd, description):
-    """Run a command and return success status."""
+def run_command(cmd, description, quiet=True):
+    """Run a command and return success status.
+
+    Only stderr is captured; stdout is discarded when quiet, otherwise it is
+    passed straight through to the terminal.
+    """
     print(f"\n🧪 {description}...")
     print(f"Running: {' '.join(cmd)}")
 
     try:
         result = subprocess.run(
-            cmd, capture_output=True, text=True, cwd=Path(__file__).parent
+            cmd,
+            stdout=subprocess.DEVNULL if quiet else None,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=Path(__file__).parent,
         )
         if result.returncode == 0:
             print(f"✅ {description} - PASSED")
@@ -41,7 +50,15 @@ def main():
 
     tests = [
         {
-            "cmd": ["python", "-m", "pytest", "tests/test_components.py", "-v"],
+            "cmd": [
+                "python",
+                "-m",
+                "pytest",
+                "tests/test_components.py",
+                "-p",
+                "no:cacheprovider",
+                "-v",
+            ],
             "description": "Component Tests",
         },
         {
@@ -50,12 +67,16 @@ def main():
         },
     ]
 
-    passed = 0
     total = len(tests)
 
-    for test in tests:
-        if run_command(test["cmd"], test["description"]):
-            passed += 1
+    # Test suites are independent subprocesses, so run them concurrently
+    with ThreadPoolExecutor(max_workers=total) as executor:
+        results = list(
+            executor.map(
+                lambda test: run_command(test["cmd"], test["description"]), tests
+            )
+        )
+    passed = sum(results)
 
     print("\n" + "=" * 50)
     print(f"📊 Test Results: {passed}/{total} test suites passed")
@@ -4,9 +4,13 @@ Check that all files have at least 60% coverage.
 """
 
 import sys
-import xml.etree.ElementTree as ET
 from pathlib import Path
 
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
 
 def check_coverage_per_file(coverage_xml_path: str, min_coverage: float = 55.0):
     """Check that each file has at least min_coverage% coverage."""
@@ -14,23 +18,24 @@ def check_coverage_per_file(coverage_xml_path: str, min_coverage: float = 55.0):
         print(f"❌ Coverage file not found: {coverage_xml_path}")
         return False
 
-    # Parse coverage XML
-    tree = ET.parse(coverage_xml_path)
-    root = tree.getroot()
-
     failed_files = []
     passed_files = []
 
-    for package in root.findall(".//package"):
-        for class_elem in package.findall(".//class"):
-            filename = class_elem.get("filename")
-            line_rate = float(class_elem.get("line-rate", 0))
-            coverage_percent = line_rate * 100
+    # Stream coverage XML, freeing each class element once it has been read
+    for _event, elem in ET.iterparse(coverage_xml_path, events=("end",)):
+        if elem.tag != "class":
+            continue
+
+        filename = elem.get("filename")
+        line_rate = float(elem.get("line-rate", 0))
+        coverage_percent = line_rate * 100
+
+        if coverage_percent < min_coverage:
+            failed_files.append((filename, coverage_percent))
+        else:
+            passed_files.append((filename, coverage_percent))
 
-            if coverage_percent < min_coverage:
-                failed_files.append((filename, coverage_percent))
-            else:
-                passed_files.append((filename, coverage_percent))
+        elem.clear()
 
     # Print results
     print(f"📊 Coverage Report (Minimum: {min_coverage}%)")
@@ -46,6 +46,7 @@ pip install --upgrade pip
 # Install dependencies
 echo "📚 Installing dependencies..."
 pip install -r requirements.txt
+pip install -e .
 
 # Create .env file if it doesn't exist
 if [ ! -f ".env" ]; then
@@ -37,6 +37,11 @@ class Settings(BaseSettings):
     email_service_url: str = Field(
         default="http://localhost:3000", alias="EMAIL_SERVICE_URL"
     )
+    compress_requests: bool = Field(default=False, alias="COMPRESS_REQUESTS")
+    email_batch_read: bool = Field(default=False, alias="EMAIL_BATCH_READ")
+
+    # System Tools
+    system_stats_ttl: float = Field(default=0.5, alias="SYSTEM_STATS_TTL")
 
     # AWS Configuration
     aws_access_key_id: str | None = Field(default=None, alias="AWS_ACCESS_KEY_ID")
@@ -1,11 +1,15 @@
 """Main MCP server implementation."""
 
+from typing import Literal
+
+import anyio
 import structlog
 from mcp.server.fastmcp import FastMCP
 
 from ..config import get_settings
 from ..tools import register_tools
 from ..utils.logging import setup_logging
+from ..utils.service import aclose_async_client
 
 logger = structlog.get_logger(__name__)
 
@@ -37,13 +41,35 @@ def create_mcp_server() -> FastMCP:
     return mcp
 
 
+async def _serve(mcp: FastMCP, transport: Literal["stdio", "streamable-http"]) -> None:
+    """Run the server, then close the shared async client on its event loop."""
+    try:
+        if transport == "stdio":
+            await mcp.run_stdio_async()
+        else:
+            await mcp.run_streamable_http_async()
+    finally:
+        await aclose_async_client()
+
+
+def serve(
+    mcp: FastMCP, transport: Literal["stdio", "streamable-http"] = "streamable-http"
+) -> None:
+    """Run the MCP server on the given transport until it stops.
+
+    Like ``FastMCP.run``, but the async service client is closed on the
+    server's event loop during shutdown.
+    """
+    anyio.run(_serve, mcp, transport)
+
+
 def run_server() -> None:
     """Run the MCP server."""
     mcp = create_mcp_server()
 
     try:
         logger.info("Starting Macro-Man MCP Server...")
-        mcp.run(transport="streamable-http")
+        serve(mcp, transport="streamable-http")
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
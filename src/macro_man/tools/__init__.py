@@ -1,18 +1,22 @@
 """MCP tools for Macro-Man server."""
 
-from .basic import register_basic_tools
-from .calendar import register_calendar_tools
-from .email import register_email_tools
-from .file_ops import register_file_tools
-from .system import register_system_tools
+from importlib import import_module
 
 __all__ = ["register_tools"]
 
+# Tool modules and their registration functions. Modules are imported on
+# demand so importing a single tool module doesn't load every other one.
+_TOOL_MODULES = (
+    ("basic", "register_basic_tools"),
+    ("file_ops", "register_file_tools"),
+    ("system", "register_system_tools"),
+    ("email", "register_email_tools"),
+    ("calendar", "register_calendar_tools"),
+)
+
 
 def register_tools(mcp_server) -> None:
     """Register all available tools with the MCP server."""
-    register_basic_tools(mcp_server)
-    register_file_tools(mcp_server)
-    register_system_tools(mcp_server)
-    register_email_tools(mcp_server)
-    register_calendar_tools(mcp_server)
+    for module_name, register_name in _TOOL_MODULES:
+        module = import_module(f".{module_name}", __package__)
+        getattr(module, register_name)(mcp_server)
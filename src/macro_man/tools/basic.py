@@ -1,5 +1,9 @@
 """Basic utility tools for the MCP server."""
 
+import platform
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 import structlog
@@ -21,7 +25,7 @@ def add_numbers(a: float, b: float) -> float:
     """
     try:
         result = a + b
-        logger.info("Numbers added", a=a, b=b, result=result)
+        logger.debug("Numbers added", a=a, b=b, result=result)
         return result
     except Exception as e:
         logger.error("Error adding numbers", error=str(e))
@@ -40,7 +44,7 @@ def multiply_numbers(a: float, b: float) -> float:
     """
     try:
         result = a * b
-        logger.info("Numbers multiplied", a=a, b=b, result=result)
+        logger.debug("Numbers multiplied", a=a, b=b, result=result)
         return result
     except Exception as e:
         logger.error("Error multiplying numbers", error=str(e))
@@ -64,22 +68,26 @@ def greet_user(name: str) -> str:
     return greeting
 
 
+@lru_cache
+def _static_system_info() -> dict[str, Any]:
+    """Get system information that doesn't change while the process runs."""
+    return {
+        "platform": platform.platform(),
+        "python_version": sys.version,
+        "architecture": platform.architecture(),
+        "processor": platform.processor(),
+    }
+
+
 def get_system_info() -> dict[str, Any]:
     """Get basic system information.
 
     Returns:
         Dictionary containing system information
     """
-    import platform
-    import sys
-    from datetime import datetime
-
     info = {
-        "platform": platform.platform(),
-        "python_version": sys.version,
-        "architecture": platform.architecture(),
-        "processor": platform.processor(),
-        "timestamp": datetime.utcnow().isoformat(),
+        **_static_system_info(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
     logger.info("System info requested")
@@ -98,7 +106,7 @@ def echo_message(message: str) -> str:
     if not message:
         raise ValidationError("Message cannot be empty", field="message")
 
-    logger.info("Message echoed", message=message)
+    logger.debug("Message echoed", message=message)
     return f"Echo: {message}"
 
 
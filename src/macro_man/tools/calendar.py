@@ -2,70 +2,109 @@
 Calendar tools for scheduling Google Meet invites via external service.
 """
 
-import json
 import re
 from collections.abc import Iterable
-from typing import Any
+from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Any, Literal
 
-import httpx
+from pydantic import Field
 
-from macro_man.config.settings import get_settings
 from macro_man.utils.exceptions import MacroManError, ValidationError
+from macro_man.utils.service import (
+    dumps,
+    get_async_client,
+    get_client,
+    service_errors,
+    service_result,
+)
+from macro_man.utils.validation import is_valid_email
+
+_SEND_UPDATES: frozenset[str] = frozenset({"all", "externalOnly", "none"})
+
+# The exact datetime shape the calendar service accepts
+_ISO_DATETIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:\d{2})", re.ASCII
+)
+
+# Argument types for the MCP tool signatures. FastMCP validates these in
+# pydantic-core before the tool runs and publishes them in the tool schema.
+_SendUpdates = Literal["all", "externalOnly", "none"]
+_PositiveInt = Annotated[int, Field(gt=0)]
+
+
+def _post_json(path: str, payload: dict[str, Any], label: str) -> dict[str, Any]:
+    """POST a JSON payload to the calendar service and return its JSON reply."""
+    with service_errors(label, "calendar"):
+        response = get_client().post(path, json=payload)
+        return service_result(response, label)
+
+
+async def _apost_json(path: str, payload: dict[str, Any], label: str) -> dict[str, Any]:
+    """Async variant of _post_json using the shared async client."""
+    with service_errors(label, "calendar"):
+        response = await get_async_client().post(path, json=payload)
+        return service_result(response, label)
 
 
 def _schedule_meet_via_service(payload: dict[str, Any]) -> dict[str, Any]:
     """Call external service to schedule a meeting."""
-    settings = get_settings()
-    service_url = f"{settings.email_service_url}/schedule-meet"
+    return _post_json("/schedule-meet", payload, "Calendar service")
+
+
+async def _schedule_meet_via_service_async(payload: dict[str, Any]) -> dict[str, Any]:
+    """Call external service to schedule a meeting without blocking the loop."""
+    return await _apost_json("/schedule-meet", payload, "Calendar service")
+
+
+def _list_events_via_service(payload: dict[str, Any]) -> dict[str, Any]:
+    """Call external service to list calendar events."""
+    return _post_json("/list-events", payload, "Calendar list service")
 
-    try:
-        response = httpx.post(
-            service_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30.0,
-        )
 
-        if response.status_code == 200:
-            return response.json()
+async def _list_events_via_service_async(payload: dict[str, Any]) -> dict[str, Any]:
+    """Call external service to list calendar events without blocking the loop."""
+    return await _apost_json("/list-events", payload, "Calendar list service")
 
-        error_msg = f"Calendar service returned status {response.status_code}"
+
+def _check_iso(value: str, field: str, example: str) -> None:
+    """Ensure value is a real YYYY-MM-DDTHH:MM:SS datetime with a UTC offset."""
+    if _ISO_DATETIME_RE.fullmatch(value):
         try:
-            detail = response.json()
-            if "message" in detail:
-                error_msg += f": {detail['message']}"
-        except (ValueError, KeyError):
-            error_msg += f": {response.text}"
-
-        raise MacroManError(error_msg)
-
-    except httpx.TimeoutException:
-        raise MacroManError("Calendar service request timed out")
-    except httpx.ConnectError:
-        raise MacroManError("Could not connect to calendar service at localhost:3000")
-    except httpx.RequestError as e:
-        raise MacroManError(f"Calendar service request failed: {e!s}")
-    except Exception as e:
-        raise MacroManError(f"Unexpected error calling calendar service: {e!s}")
+            datetime.fromisoformat(value.replace("Z", "+00:00"))
+            return
+        except ValueError:
+            pass
+    raise ValidationError(f"{field} must be ISO8601 like {example}", field=field)
 
 
-def _validate_emails(attendees: Iterable[str]) -> list[str]:
-    """Validate attendee emails and return cleaned list."""
+@lru_cache(maxsize=1024)
+def _validate_emails_cached(attendees: tuple[str, ...]) -> tuple[str, ...]:
+    """Validate attendee emails, memoized for repeated attendee lists."""
     cleaned: list[str] = []
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
     for email in attendees:
-        if not isinstance(email, str) or not email.strip():
+        email_clean = email.strip()
+        if not email_clean:
             raise ValidationError(
                 "Attendee email must be a non-empty string", field="attendees"
             )
-        email_clean = email.strip()
-        if not re.match(email_pattern, email_clean):
+        if not is_valid_email(email_clean):
             raise ValidationError("Invalid attendee email format", field="attendees")
         cleaned.append(email_clean)
-    return cleaned
+    return tuple(cleaned)
 
 
-def schedule_meet(
+def _validate_emails(attendees: Iterable[str]) -> list[str]:
+    """Validate attendee emails and return cleaned list."""
+    attendees = tuple(attendees)
+    if not all(isinstance(email, str) for email in attendees):
+        raise ValidationError(
+            "Attendee email must be a non-empty string", field="attendees"
+        )
+    return list(_validate_emails_cached(attendees))
+
+
+def _schedule_meet_payload(
     title: str,
     description: str | None,
     start: str,
@@ -74,29 +113,21 @@ def schedule_meet(
     attendees: list[str] | None = None,
     sendUpdates: str | None = None,
 ) -> dict[str, Any]:
-    """
-    Schedule a Google Meet calendar invite via external service.
-    """
-
-    if not title or not title.strip():
+    """Validate schedule_meet arguments and build the service payload."""
+    title = (title or "").strip()
+    start = (start or "").strip()
+    end = (end or "").strip()
+    if not title:
         raise ValidationError("Title is required", field="title")
-    if not start or not start.strip():
+    if not start:
         raise ValidationError("Start datetime is required", field="start")
-    if not end or not end.strip():
+    if not end:
         raise ValidationError("End datetime is required", field="end")
 
-    # Basic ISO8601-like validation for datetime strings
-    iso_like = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:\d{2})$"
-    if not re.match(iso_like, start.strip()):
-        raise ValidationError(
-            "start must be ISO8601 like 2025-10-21T10:00:00Z", field="start"
-        )
-    if not re.match(iso_like, end.strip()):
-        raise ValidationError(
-            "end must be ISO8601 like 2025-10-21T10:30:00Z", field="end"
-        )
+    _check_iso(start, "start", "2025-10-21T10:00:00Z")
+    _check_iso(end, "end", "2025-10-21T10:30:00Z")
 
-    if sendUpdates is not None and sendUpdates not in {"all", "externalOnly", "none"}:
+    if sendUpdates is not None and sendUpdates not in _SEND_UPDATES:
         raise ValidationError(
             "sendUpdates must be one of: all, externalOnly, none",
             field="sendUpdates",
@@ -110,19 +141,39 @@ def schedule_meet(
             )
         cleaned_attendees = _validate_emails(attendees)
 
-    payload: dict[str, Any] = {
-        "title": title.strip(),
-        "start": start.strip(),
-        "end": end.strip(),
-    }
-    if description is not None and description.strip():
-        payload["description"] = description.strip()
-    if timeZone is not None and timeZone.strip():
-        payload["timeZone"] = timeZone.strip()
-    if cleaned_attendees is not None:
-        payload["attendees"] = cleaned_attendees
-    if sendUpdates is not None:
-        payload["sendUpdates"] = sendUpdates
+    fields = (
+        ("title", title),
+        ("start", start),
+        ("end", end),
+        ("description", (description or "").strip() or None),
+        ("timeZone", (timeZone or "").strip() or None),
+        ("attendees", cleaned_attendees),
+        ("sendUpdates", sendUpdates),
+    )
+    return {key: value for key, value in fields if value is not None}
+
+
+def schedule_meet(
+    title: str,
+    description: str | None,
+    start: str,
+    end: str,
+    timeZone: str | None = None,
+    attendees: list[str] | None = None,
+    sendUpdates: str | None = None,
+) -> dict[str, Any]:
+    """
+    Schedule a Google Meet calendar invite via external service.
+    """
+    payload = _schedule_meet_payload(
+        title=title,
+        description=description,
+        start=start,
+        end=end,
+        timeZone=timeZone,
+        attendees=attendees,
+        sendUpdates=sendUpdates,
+    )
 
     try:
         return _schedule_meet_via_service(payload)
@@ -130,40 +181,63 @@ def schedule_meet(
         raise MacroManError(f"Failed to schedule meeting: {e!s}")
 
 
-def _list_events_via_service(payload: dict[str, Any]) -> dict[str, Any]:
-    """Call external service to list calendar events."""
-    settings = get_settings()
-    service_url = f"{settings.email_service_url}/list-events"
+async def schedule_meet_async(
+    title: str,
+    description: str | None,
+    start: str,
+    end: str,
+    timeZone: str | None = None,
+    attendees: list[str] | None = None,
+    sendUpdates: str | None = None,
+) -> dict[str, Any]:
+    """
+    Schedule a Google Meet calendar invite without blocking the event loop.
+    """
+    payload = _schedule_meet_payload(
+        title=title,
+        description=description,
+        start=start,
+        end=end,
+        timeZone=timeZone,
+        attendees=attendees,
+        sendUpdates=sendUpdates,
+    )
 
     try:
-        response = httpx.post(
-            service_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30.0,
-        )
+        return await _schedule_meet_via_service_async(payload)
+    except Exception as e:
+        raise MacroManError(f"Failed to schedule meeting: {e!s}")
 
-        if response.status_code == 200:
-            return response.json()
 
-        error_msg = f"Calendar list service returned status {response.status_code}"
-        try:
-            detail = response.json()
-            if "message" in detail:
-                error_msg += f": {detail['message']}"
-        except (ValueError, KeyError):
-            error_msg += f": {response.text}"
-
-        raise MacroManError(error_msg)
-
-    except httpx.TimeoutException:
-        raise MacroManError("Calendar list service request timed out")
-    except httpx.ConnectError:
-        raise MacroManError("Could not connect to calendar service at localhost:3000")
-    except httpx.RequestError as e:
-        raise MacroManError(f"Calendar list service request failed: {e!s}")
-    except Exception as e:
-        raise MacroManError(f"Unexpected error calling calendar list service: {e!s}")
+def _list_events_payload(
+    timeMin: str,
+    timeMax: str,
+    maxResults: int | None = None,
+    q: str | None = None,
+) -> dict[str, Any]:
+    """Validate list_events arguments and build the service payload."""
+    timeMin = (timeMin or "").strip()
+    timeMax = (timeMax or "").strip()
+    if not timeMin:
+        raise ValidationError("timeMin is required", field="timeMin")
+    if not timeMax:
+        raise ValidationError("timeMax is required", field="timeMax")
+
+    _check_iso(timeMin, "timeMin", "2025-10-20T00:00:00Z")
+    _check_iso(timeMax, "timeMax", "2025-10-27T23:59:59Z")
+
+    if maxResults is not None and (not isinstance(maxResults, int) or maxResults <= 0):
+        raise ValidationError(
+            "maxResults must be a positive integer", field="maxResults"
+        )
+
+    fields = (
+        ("timeMin", timeMin),
+        ("timeMax", timeMax),
+        ("maxResults", maxResults),
+        ("q", (q or "").strip() or None),
+    )
+    return {key: value for key, value in fields if value is not None}
 
 
 def list_events(
@@ -184,38 +258,39 @@ def list_events(
     Returns:
         Dictionary with list of events as provided by the service
     """
-    if not timeMin or not timeMin.strip():
-        raise ValidationError("timeMin is required", field="timeMin")
-    if not timeMax or not timeMax.strip():
-        raise ValidationError("timeMax is required", field="timeMax")
+    payload = _list_events_payload(
+        timeMin=timeMin,
+        timeMax=timeMax,
+        maxResults=maxResults,
+        q=q,
+    )
 
-    # Basic ISO8601-like validation for datetime strings
-    iso_like = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:\d{2})$"
-    if not re.match(iso_like, timeMin.strip()):
-        raise ValidationError(
-            "timeMin must be ISO8601 like 2025-10-20T00:00:00Z", field="timeMin"
-        )
-    if not re.match(iso_like, timeMax.strip()):
-        raise ValidationError(
-            "timeMax must be ISO8601 like 2025-10-27T23:59:59Z", field="timeMax"
-        )
+    try:
+        return _list_events_via_service(payload)
+    except Exception as e:
+        raise MacroManError(f"Failed to list events: {e!s}")
 
-    if maxResults is not None and (not isinstance(maxResults, int) or maxResults <= 0):
-        raise ValidationError(
-            "maxResults must be a positive integer", field="maxResults"
-        )
 
-    payload: dict[str, Any] = {
-        "timeMin": timeMin.strip(),
-        "timeMax": timeMax.strip(),
-    }
-    if maxResults is not None:
-        payload["maxResults"] = maxResults
-    if q is not None and q.strip():
-        payload["q"] = q.strip()
+async def list_events_async(
+    timeMin: str,
+    timeMax: str,
+    maxResults: int | None = None,
+    q: str | None = None,
+) -> dict[str, Any]:
+    """
+    List calendar events without blocking the event loop.
+
+    Takes the same arguments as list_events.
+    """
+    payload = _list_events_payload(
+        timeMin=timeMin,
+        timeMax=timeMax,
+        maxResults=maxResults,
+        q=q,
+    )
 
     try:
-        return _list_events_via_service(payload)
+        return await _list_events_via_service_async(payload)
     except Exception as e:
         raise MacroManError(f"Failed to list events: {e!s}")
 
@@ -224,17 +299,17 @@ def register_calendar_tools(mcp_server) -> None:
     """Register calendar scheduling tools."""
 
     @mcp_server.tool()
-    def _schedule_meet(
+    async def _schedule_meet(
         title: str,
         description: str | None,
         start: str,
         end: str,
         timeZone: str | None = None,
         attendees: list[str] | None = None,
-        sendUpdates: str | None = None,
+        sendUpdates: _SendUpdates | None = None,
     ) -> str:
         try:
-            result = schedule_meet(
+            result = await schedule_meet_async(
                 title=title,
                 description=description,
                 start=start,
@@ -243,22 +318,21 @@ def register_calendar_tools(mcp_server) -> None:
                 attendees=attendees,
                 sendUpdates=sendUpdates,
             )
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": str(e),
                     "message": "Failed to schedule meeting",
-                },
-                indent=2,
+                }
             )
 
     @mcp_server.tool()
-    def _list_events(
+    async def _list_events(
         timeMin: str,
         timeMax: str,
-        maxResults: int | None = None,
+        maxResults: _PositiveInt | None = None,
         q: str | None = None,
     ) -> str:
         """
@@ -268,19 +342,18 @@ def register_calendar_tools(mcp_server) -> None:
             JSON string with list of events
         """
         try:
-            result = list_events(
+            result = await list_events_async(
                 timeMin=timeMin,
                 timeMax=timeMax,
                 maxResults=maxResults,
                 q=q,
             )
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": str(e),
                     "message": "Failed to list events",
-                },
-                indent=2,
+                }
             )
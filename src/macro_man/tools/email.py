@@ -2,14 +2,97 @@
 Email tools for sending emails via external email service.
 """
 
-import json
+import asyncio
+import gzip
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
-import httpx
+import orjson
 
 from macro_man.config.settings import get_settings
 from macro_man.utils.exceptions import MacroManError, ValidationError
+from macro_man.utils.service import (
+    dumps,
+    get_async_client,
+    get_client,
+    service_errors,
+    service_result,
+)
+from macro_man.utils.validation import is_valid_email
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\Z")
+
+# Maximum number of message IDs sent in one batch read request
+_READ_BATCH_SIZE = 100
+# Statuses meaning the service has no batch read support
+_BATCH_UNSUPPORTED = frozenset({404, 501})
+# Request bodies at least this large are gzipped when compression is enabled
+_COMPRESS_MIN_BYTES = 1024
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GZIP_JSON_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
+
+@lru_cache(maxsize=1)
+def _compress_requests() -> bool:
+    """Whether large request bodies should be gzipped (read once)."""
+    return get_settings().compress_requests
+
+
+def _post_kwargs(payload: dict[str, Any]) -> dict[str, Any]:
+    """Build the request body arguments for a POST to the email service.
+
+    The payload is serialized once with orjson. When ``compress_requests`` is
+    enabled, bodies of at least 1 KiB are sent gzip-compressed with a
+    ``Content-Encoding`` header.
+    """
+    content = orjson.dumps(payload)
+    if len(content) >= _COMPRESS_MIN_BYTES and _compress_requests():
+        return {
+            "content": gzip.compress(content, compresslevel=6),
+            "headers": _GZIP_JSON_HEADERS,
+        }
+    return {"content": content, "headers": _JSON_HEADERS}
+
+
+def _clean_send_args(to: str, subject: str, body: str) -> tuple[str, str, str]:
+    """Validate send_email arguments and return them stripped."""
+    # Clean and validate inputs
+    to = (to or "").strip()
+    if not to:
+        raise ValidationError("Recipient email address is required", field="to")
+
+    subject = (subject or "").strip()
+    if not subject:
+        raise ValidationError("Email subject is required", field="subject")
+
+    body = (body or "").strip()
+    if not body:
+        raise ValidationError("Email body is required", field="body")
+
+    # Validate email format (basic validation)
+    if not is_valid_email(to):
+        raise ValidationError("Invalid email address format", field="to")
+
+    return to, subject, body
+
+
+def _send_result(
+    email_result: dict[str, Any], to: str, subject: str, body: str
+) -> dict[str, Any]:
+    """Build the send_email result from the service response."""
+    return {
+        "success": email_result.get("success", False),
+        "message": email_result.get("message", "Email sent successfully"),
+        "messageId": email_result.get("messageId"),
+        "recipient": to,
+        "subject": subject,
+        "body_length": len(body),
+        "details": email_result,
+    }
 
 
 def send_email(to: str, subject: str, body: str) -> dict[str, Any]:
@@ -28,89 +111,95 @@ def send_email(to: str, subject: str, body: str) -> dict[str, Any]:
         ValidationError: If required parameters are invalid
         MacroManError: If email sending fails
     """
-    # Validate inputs
-    if not to or not to.strip():
-        raise ValidationError("Recipient email address is required", field="to")
+    to, subject, body = _clean_send_args(to, subject, body)
 
-    if not subject or not subject.strip():
-        raise ValidationError("Email subject is required", field="subject")
+    # Send email via the actual email service
+    try:
+        email_result = _send_email_via_service(to, subject, body)
+        return _send_result(email_result, to, subject, body)
 
-    if not body or not body.strip():
-        raise ValidationError("Email body is required", field="body")
+    except Exception as e:
+        raise MacroManError(f"Failed to send email: {e!s}")
 
-    # Clean inputs
-    to = to.strip()
-    subject = subject.strip()
-    body = body.strip()
 
-    # Validate email format (basic validation)
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(email_pattern, to):
-        raise ValidationError("Invalid email address format", field="to")
+async def send_email_async(to: str, subject: str, body: str) -> dict[str, Any]:
+    """
+    Send an email without blocking the event loop.
 
-    # Send email via the actual email service
-    try:
-        email_result = _send_email_via_service(to, subject, body)
+    Takes the same arguments and returns the same result as send_email.
+    """
+    to, subject, body = _clean_send_args(to, subject, body)
 
-        return {
-            "success": email_result.get("success", False),
-            "message": email_result.get("message", "Email sent successfully"),
-            "messageId": email_result.get("messageId"),
-            "recipient": to,
-            "subject": subject,
-            "body_length": len(body),
-            "details": email_result,
-        }
+    try:
+        email_result = await _send_email_via_service_async(to, subject, body)
+        return _send_result(email_result, to, subject, body)
 
     except Exception as e:
         raise MacroManError(f"Failed to send email: {e!s}")
 
 
+async def send_emails_bulk(
+    messages: Iterable[tuple[str, str, str]],
+) -> list[dict[str, Any]]:
+    """
+    Send several emails concurrently.
+
+    A failed send doesn't stop the others; it is reported in place as a
+    result with ``success`` set to False and the error message.
+
+    Args:
+        messages: (to, subject, body) tuples
+
+    Returns:
+        List of send results in the same order as messages
+    """
+    messages = list(messages)
+    outcomes = await asyncio.gather(
+        *(send_email_async(to, subject, body) for to, subject, body in messages),
+        return_exceptions=True,
+    )
+
+    results: list[dict[str, Any]] = []
+    for (to, subject, _), outcome in zip(messages, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            results.append(
+                {
+                    "success": False,
+                    "error": str(outcome),
+                    "message": "Failed to send email",
+                    "recipient": to,
+                    "subject": subject,
+                }
+            )
+        else:
+            results.append(outcome)
+    return results
+
+
 def _send_email_via_service(to: str, subject: str, body: str) -> dict[str, Any]:
     """
     Send email via the actual email service.
     """
+    payload = {"to": to, "subject": subject, "body": body}
 
-    # Get email service URL from settings
-    settings = get_settings()
-    email_service_url = f"{settings.email_service_url}/send-email"
+    with service_errors("Email service", "email"):
+        response = get_client().post("/send-email", **_post_kwargs(payload))
+        return service_result(response, "Email service")
 
-    # Prepare the request payload
-    payload = {"to": to, "subject": subject, "body": body}
 
-    try:
-        # Make HTTP request to the email service
-        response = httpx.post(
-            email_service_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30.0,
-        )
+async def _send_email_via_service_async(
+    to: str, subject: str, body: str
+) -> dict[str, Any]:
+    """
+    Send email via the actual email service using the async client.
+    """
+    payload = {"to": to, "subject": subject, "body": body}
 
-        # Check if the request was successful
-        if response.status_code == 200:
-            result = response.json()
-            return result
-        else:
-            # Handle HTTP errors
-            error_msg = f"Email service returned status {response.status_code}"
-            try:
-                error_detail = response.json()
-                if "message" in error_detail:
-                    error_msg += f": {error_detail['message']}"
-            except (ValueError, KeyError):
-                error_msg += f": {response.text}"
-
-            raise MacroManError(error_msg)
-
-    except httpx.TimeoutException:
-        raise MacroManError("Email service request timed out")
-    except httpx.ConnectError:
-        raise MacroManError("Could not connect to email service at localhost:3000")
-    except httpx.RequestError as e:
-        raise MacroManError(f"Email service request failed: {e!s}")
-    except Exception as e:
-        raise MacroManError(f"Unexpected error calling email service: {e!s}")
+    with service_errors("Email service", "email"):
+        response = await get_async_client().post("/send-email", **_post_kwargs(payload))
+        return service_result(response, "Email service")
 
 
 def _read_email_via_service(payload: dict[str, Any]) -> dict[str, Any]:
@@ -123,39 +212,9 @@ def _read_email_via_service(payload: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Dictionary with read email results as provided by the service
     """
-
-    settings = get_settings()
-    read_service_url = f"{settings.email_service_url}/read-email"
-
-    try:
-        response = httpx.post(
-            read_service_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30.0,
-        )
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            error_msg = f"Email read service returned status {response.status_code}"
-            try:
-                error_detail = response.json()
-                if "message" in error_detail:
-                    error_msg += f": {error_detail['message']}"
-            except (ValueError, KeyError):
-                error_msg += f": {response.text}"
-
-            raise MacroManError(error_msg)
-
-    except httpx.TimeoutException:
-        raise MacroManError("Email read service request timed out")
-    except httpx.ConnectError:
-        raise MacroManError("Could not connect to email service at localhost:3000")
-    except httpx.RequestError as e:
-        raise MacroManError(f"Email read service request failed: {e!s}")
-    except Exception as e:
-        raise MacroManError(f"Unexpected error calling email read service: {e!s}")
+    with service_errors("Email read service", "email"):
+        response = get_client().post("/read-email", json=payload)
+        return service_result(response, "Email read service")
 
 
 def read_email(
@@ -178,13 +237,20 @@ def read_email(
         includeBody: Whether to include full body content in results
     """
 
+    # Strip optional string filters once
+    fromName = (fromName or "").strip()
+    subjectContains = (subjectContains or "").strip()
+    threadContains = (threadContains or "").strip()
+    if after is not None:
+        after = after.strip()
+
     # Validate simple types
     if maxResults is not None and (not isinstance(maxResults, int) or maxResults <= 0):
         raise ValidationError(
             "maxResults must be a positive integer", field="maxResults"
         )
 
-    if after is not None and not re.match(r"^\d{4}-\d{2}-\d{2}$", after.strip()):
+    if after is not None and not _DATE_RE.match(after):
         # Basic YYYY-MM-DD validation
         raise ValidationError(
             "after must be a date string in format YYYY-MM-DD", field="after"
@@ -192,14 +258,14 @@ def read_email(
 
     # Build payload with only provided keys
     payload: dict[str, Any] = {}
-    if fromName is not None and fromName.strip():
-        payload["fromName"] = fromName.strip()
-    if subjectContains is not None and subjectContains.strip():
-        payload["subjectContains"] = subjectContains.strip()
-    if threadContains is not None and threadContains.strip():
-        payload["threadContains"] = threadContains.strip()
-    if after is not None and after.strip():
-        payload["after"] = after.strip()
+    if fromName:
+        payload["fromName"] = fromName
+    if subjectContains:
+        payload["subjectContains"] = subjectContains
+    if threadContains:
+        payload["threadContains"] = threadContains
+    if after:
+        payload["after"] = after
     if maxResults is not None:
         payload["maxResults"] = maxResults
     if includeBody is not None:
@@ -212,11 +278,90 @@ def read_email(
         raise MacroManError(f"Failed to read emails: {e!s}")
 
 
+def _check_batch_ids(
+    requested: list[str], emails: list[dict[str, Any]], label: str
+) -> None:
+    """Ensure a batch read returned exactly the requested emails.
+
+    A service that ignores the ``ids`` filter answers with an unrelated
+    listing, which must not be passed off as the requested batch.
+    """
+    returned = {e.get("id") if isinstance(e, dict) else None for e in emails}
+    wanted = set(requested)
+    if returned != wanted:
+        missing = sorted(wanted - returned)
+        unexpected = len(returned - wanted)
+        raise MacroManError(
+            f"{label} did not return the requested emails "
+            f"(missing: {', '.join(missing) or 'none'}; unexpected: {unexpected})"
+        )
+
+
+async def read_emails_batch(
+    ids: list[str], includeBody: bool = True
+) -> list[dict[str, Any]]:
+    """
+    Read several emails by ID with as few service calls as possible.
+
+    IDs are sent to the read service in chunks of up to 100. If the service
+    doesn't support batch reads (404/501), each ID in the chunk is fetched
+    individually and concurrently instead. Requires ``email_batch_read`` to
+    be enabled, and fails if the service returns emails other than the ones
+    requested.
+
+    Args:
+        ids: Message IDs to read
+        includeBody: Whether to include full body content in results
+
+    Returns:
+        List of emails as provided by the service
+    """
+    if not isinstance(ids, list) or not ids:
+        raise ValidationError("ids must be a non-empty list", field="ids")
+    if not all(isinstance(i, str) and i.strip() for i in ids):
+        raise ValidationError("ids must be non-empty strings", field="ids")
+    if not get_settings().email_batch_read:
+        raise MacroManError(
+            "Batch email reads are disabled; set EMAIL_BATCH_READ=true once the "
+            "email service supports them"
+        )
+
+    label = "Email read service"
+    emails: list[dict[str, Any]] = []
+    try:
+        with service_errors(label, "email"):
+            for start in range(0, len(ids), _READ_BATCH_SIZE):
+                chunk = [i.strip() for i in ids[start : start + _READ_BATCH_SIZE]]
+                response = await get_async_client().post(
+                    "/read-email", json={"ids": chunk, "includeBody": includeBody}
+                )
+                if response.status_code in _BATCH_UNSUPPORTED:
+                    responses = await asyncio.gather(
+                        *(
+                            get_async_client().post(
+                                "/read-email",
+                                json={"id": i, "includeBody": includeBody},
+                            )
+                            for i in chunk
+                        )
+                    )
+                    results = [service_result(r, label) for r in responses]
+                else:
+                    results = [service_result(response, label)]
+                chunk_emails = [e for r in results for e in r.get("emails", [])]
+                _check_batch_ids(chunk, chunk_emails, label)
+                emails.extend(chunk_emails)
+    except Exception as e:
+        raise MacroManError(f"Failed to read emails: {e!s}")
+
+    return emails
+
+
 def register_email_tools(mcp_server):
     """Register email tools with the MCP server."""
 
     @mcp_server.tool()
-    def _send_email(to: str, subject: str, body: str) -> str:
+    async def _send_email(to: str, subject: str, body: str) -> str:
         """
         Send an email via the external email service.
 
@@ -229,12 +374,11 @@ def register_email_tools(mcp_server):
             JSON string with email sending result
         """
         try:
-            result = send_email(to, subject, body)
-            return json.dumps(result, indent=2)
+            result = await send_email_async(to, subject, body)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(
-                {"success": False, "error": str(e), "message": "Failed to send email"},
-                indent=2,
+            return dumps(
+                {"success": False, "error": str(e), "message": "Failed to send email"}
             )
 
     @mcp_server.tool()
@@ -261,9 +405,24 @@ def register_email_tools(mcp_server):
                 maxResults=maxResults,
                 includeBody=includeBody,
             )
-            return json.dumps(result, indent=2)
+            return dumps(result)
+        except Exception as e:
+            return dumps(
+                {"success": False, "error": str(e), "message": "Failed to read emails"}
+            )
+
+    @mcp_server.tool()
+    async def _read_emails_batch(ids: list[str], includeBody: bool = True) -> str:
+        """
+        Read several emails by ID in as few service calls as possible.
+
+        Returns:
+            JSON string with the list of emails
+        """
+        try:
+            emails = await read_emails_batch(ids, includeBody=includeBody)
+            return dumps({"success": True, "total": len(emails), "emails": emails})
         except Exception as e:
-            return json.dumps(
-                {"success": False, "error": str(e), "message": "Failed to read emails"},
-                indent=2,
+            return dumps(
+                {"success": False, "error": str(e), "message": "Failed to read emails"}
             )
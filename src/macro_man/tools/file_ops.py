@@ -1,9 +1,13 @@
 """File operation tools for the MCP server."""
 
 import json
+import math
+import os
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
+import orjson
 import structlog
 
 from ..utils.exceptions import MacroManError, ValidationError
@@ -11,6 +15,45 @@ from ..utils.exceptions import MacroManError, ValidationError
 logger = structlog.get_logger(__name__)
 
 
+def _has_nonfinite(data: Any) -> bool:
+    """Whether data contains a NaN or infinite float anywhere."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(map(_has_nonfinite, data.values()))
+    if isinstance(data, (list, tuple)):
+        return any(map(_has_nonfinite, data))
+    return False
+
+
+def _json_dumps(data: Any, indent: int) -> bytes:
+    """Serialize data as UTF-8 JSON, using orjson for the default indent.
+
+    orjson writes NaN/Infinity as null and rejects integers wider than 64
+    bits, so those cases go through the stdlib encoder to keep its output.
+    """
+    if indent == 2 and not _has_nonfinite(data):
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def _existing_file(file_path: str) -> Path:
+    """Return file_path as a Path, raising ValidationError unless it is a file."""
+    path = Path(file_path)
+    if not path.exists():
+        raise ValidationError(f"File does not exist: {file_path}", field="file_path")
+
+    if not path.is_file():
+        raise ValidationError(f"Path is not a file: {file_path}", field="file_path")
+
+    return path
+
+
 def read_file(file_path: str) -> str:
     """Read the contents of a text file.
 
@@ -21,14 +64,7 @@ def read_file(file_path: str) -> str:
         The contents of the file
     """
     try:
-        path = Path(file_path)
-        if not path.exists():
-            raise ValidationError(
-                f"File does not exist: {file_path}", field="file_path"
-            )
-
-        if not path.is_file():
-            raise ValidationError(f"Path is not a file: {file_path}", field="file_path")
+        path = _existing_file(file_path)
 
         with open(path, encoding="utf-8") as f:
             content = f.read()
@@ -44,6 +80,44 @@ def read_file(file_path: str) -> str:
         raise MacroManError(f"Failed to read file: {e!s}")
 
 
+def _write(file_path: str, content: str | bytes, overwrite: bool) -> dict[str, Any]:
+    """Write text or bytes to file_path and return the write_file result.
+
+    Bytes are written as-is in binary mode; text is encoded as UTF-8.
+    """
+    path = Path(file_path)
+    mode, encoding = ("b", None) if isinstance(content, bytes) else ("", "utf-8")
+
+    # Create parent directories if they don't exist
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Create the file exclusively so the existence check and the open are
+    # one atomic step; only truncate an existing file when allowed to
+    try:
+        with open(path, "x" + mode, encoding=encoding) as f:
+            f.write(content)
+        overwritten = False
+    except FileExistsError:
+        if not overwrite:
+            raise ValidationError(
+                f"File already exists: {file_path}. Use overwrite=True to replace it.",
+                field="file_path",
+            )
+        with open(path, "w" + mode, encoding=encoding) as f:
+            f.write(content)
+        overwritten = True
+
+    result = {
+        "success": True,
+        "file_path": str(path if path.is_absolute() else path.absolute()),
+        "size": len(content),
+        "overwritten": overwritten,
+    }
+
+    logger.info("File written", **result)
+    return result
+
+
 def write_file(file_path: str, content: str, overwrite: bool = False) -> dict[str, Any]:
     """Write content to a text file.
 
@@ -56,29 +130,7 @@ def write_file(file_path: str, content: str, overwrite: bool = False) -> dict[st
         Dictionary with operation result
     """
     try:
-        path = Path(file_path)
-
-        if path.exists() and not overwrite:
-            raise ValidationError(
-                f"File already exists: {file_path}. Use overwrite=True to replace it.",
-                field="file_path",
-            )
-
-        # Create parent directories if they don't exist
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        result = {
-            "success": True,
-            "file_path": str(path.absolute()),
-            "size": len(content),
-            "overwritten": path.exists() and overwrite,
-        }
-
-        logger.info("File written", **result)
-        return result
+        return _write(file_path, content, overwrite)
 
     except (ValidationError, PermissionError, OSError):
         # Re-raise validation errors and common file errors as-is
@@ -89,18 +141,31 @@ def write_file(file_path: str, content: str, overwrite: bool = False) -> dict[st
 
 
 def list_directory(
-    directory_path: str = ".", include_hidden: bool = False
+    directory_path: str = ".",
+    include_hidden: bool = False,
+    limit: int | None = None,
+    offset: int = 0,
 ) -> list[dict[str, Any]]:
     """List files and directories in a given path.
 
+    Entries are sorted by name before paging, so consecutive offsets return
+    consecutive pages. Only the entries in the requested page are stat'ed.
+
     Args:
         directory_path: Path to the directory to list
         include_hidden: Whether to include hidden files/directories
+        limit: Maximum number of entries to return (all if None)
+        offset: Number of entries to skip
 
     Returns:
         List of dictionaries with file/directory information
     """
     try:
+        if limit is not None and limit <= 0:
+            raise ValidationError("limit must be a positive integer", field="limit")
+        if offset < 0:
+            raise ValidationError("offset must not be negative", field="offset")
+
         path = Path(directory_path)
         if not path.exists():
             raise ValidationError(
@@ -112,25 +177,34 @@ def list_directory(
                 f"Path is not a directory: {directory_path}", field="directory_path"
             )
 
-        items = []
-        for item in path.iterdir():
-            if not include_hidden and item.name.startswith("."):
-                continue
+        # os.scandir caches each entry's file type and stat result, so every
+        # entry costs at most one stat call
+        with os.scandir(path) as it:
+            entries = [
+                entry
+                for entry in it
+                if include_hidden or not entry.name.startswith(".")
+            ]
+
+        # Sort by name
+        entries.sort(key=attrgetter("name"))
+        end = None if limit is None else offset + limit
 
+        items = []
+        for entry in entries[offset:end]:
+            is_file = entry.is_file()
+            stat = entry.stat()
             items.append(
                 {
-                    "name": item.name,
-                    "path": str(item),
-                    "is_file": item.is_file(),
-                    "is_directory": item.is_dir(),
-                    "size": item.stat().st_size if item.is_file() else None,
-                    "modified": item.stat().st_mtime,
+                    "name": entry.name,
+                    "path": str(path / entry.name),
+                    "is_file": is_file,
+                    "is_directory": entry.is_dir(),
+                    "size": stat.st_size if is_file else None,
+                    "modified": stat.st_mtime,
                 }
             )
 
-        # Sort by name
-        items.sort(key=lambda x: str(x["name"]))
-
         logger.info("Directory listed", directory_path=directory_path, count=len(items))
         return items
 
@@ -154,10 +228,13 @@ def read_json_file(file_path: str) -> dict[str, Any]:
         Parsed JSON data as a dictionary
     """
     try:
-        content = read_file(file_path)
+        # Parse the UTF-8 bytes directly, skipping a separate text decode.
+        # The stdlib parser is kept because orjson turns integers wider than
+        # 64 bits into floats and rejects NaN/Infinity.
+        content = _existing_file(file_path).read_bytes()
         data = json.loads(content)
 
-        logger.info("JSON file read", file_path=file_path)
+        logger.info("JSON file read", file_path=file_path, size=len(content))
         return data
 
     except json.JSONDecodeError as e:
@@ -180,11 +257,11 @@ def write_json_file(
         overwrite: Whether to overwrite existing files
 
     Returns:
-        Dictionary with operation result
+        Dictionary with operation result; "size" is the file size in bytes
     """
     try:
-        content = json.dumps(data, indent=indent, ensure_ascii=False)
-        result = write_file(file_path, content, overwrite=overwrite)
+        # Write the serialized bytes directly rather than through a text layer
+        result = _write(file_path, _json_dumps(data, indent), overwrite)
 
         logger.info("JSON file written", file_path=file_path)
         return result
@@ -198,30 +275,16 @@ def write_json_file(
 
 
 def register_file_tools(mcp_server) -> None:
-    """Register file operation tools."""
-
-    @mcp_server.tool()
-    def _read_file(file_path: str) -> str:
-        return read_file(file_path)
-
-    @mcp_server.tool()
-    def _write_file(
-        file_path: str, content: str, overwrite: bool = False
-    ) -> dict[str, Any]:
-        return write_file(file_path, content, overwrite)
-
-    @mcp_server.tool()
-    def _list_directory(
-        directory_path: str = ".", include_hidden: bool = False
-    ) -> list[dict[str, Any]]:
-        return list_directory(directory_path, include_hidden)
-
-    @mcp_server.tool()
-    def _read_json_file(file_path: str) -> dict[str, Any]:
-        return read_json_file(file_path)
-
-    @mcp_server.tool()
-    def _write_json_file(
-        file_path: str, data: dict[str, Any], indent: int = 2, overwrite: bool = False
-    ) -> dict[str, Any]:
-        return write_json_file(file_path, data, indent, overwrite)
+    """Register file operation tools.
+
+    The module-level functions are registered directly under their tool names
+    rather than through forwarding closures.
+    """
+    for name, func in (
+        ("_read_file", read_file),
+        ("_write_file", write_file),
+        ("_list_directory", list_directory),
+        ("_read_json_file", read_json_file),
+        ("_write_json_file", write_json_file),
+    ):
+        mcp_server.tool(name=name)(func)
@@ -1,18 +1,123 @@
 """System utility tools for the MCP server."""
 
 import os
+import re
+import shlex
 import subprocess
 import sys
-from datetime import datetime
-from typing import Any
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-import psutil
 import structlog
 
+if TYPE_CHECKING:
+    import psutil
+
+from ..config.settings import get_settings
 from ..utils.exceptions import MacroManError, ValidationError
 
 logger = structlog.get_logger(__name__)
 
+# Potentially destructive operations execute_command refuses to run. su and
+# sudo must be whole words so commands like "echo result" aren't rejected.
+_DANGEROUS_COMMAND_RE = re.compile(
+    r"\b(?:rm\s+-rf|sudo\b|su\b|chmod\s+777|dd\s+if=|mkfs)", re.IGNORECASE
+)
+
+# Minimum seconds between CPU usage samples; faster calls reuse the last one
+_CPU_SAMPLE_INTERVAL = 0.1
+
+# Last CPU usage sample; "time" is None until the first sample is taken
+_cpu_sample: dict[str, Any] = {"time": None, "percent": 0.0}
+
+
+def _cpu_percent() -> float:
+    """Return system-wide CPU usage since the previous sample without blocking.
+
+    The first call has no previous sample to compare against, so it measures
+    over _CPU_SAMPLE_INTERVAL instead.
+    """
+    import psutil
+
+    now = time.monotonic()
+    if _cpu_sample["time"] is None:
+        _cpu_sample["percent"] = psutil.cpu_percent(interval=_CPU_SAMPLE_INTERVAL)
+        _cpu_sample["time"] = time.monotonic()
+    elif now - _cpu_sample["time"] >= _CPU_SAMPLE_INTERVAL:
+        _cpu_sample["percent"] = psutil.cpu_percent(interval=None)
+        _cpu_sample["time"] = now
+    return _cpu_sample["percent"]
+
+
+@contextmanager
+def _tool_errors(action: str, **context: Any) -> Iterator[None]:
+    """Log and wrap unexpected errors raised while running a system tool.
+
+    MacroManError (including ValidationError) propagates unchanged; anything
+    else is logged and re-raised as a MacroManError.
+    """
+    try:
+        yield
+    except MacroManError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to {action}", error=str(e), **context)
+        raise MacroManError(f"Failed to {action}: {e!s}")
+
+
+@lru_cache(maxsize=1)
+def _cpu_count() -> int | None:
+    """Get the logical CPU count, which doesn't change while the server runs."""
+    import psutil
+
+    return psutil.cpu_count()
+
+
+# Sections get_system_stats can report, in response order
+_STATS_SECTIONS: tuple[str, ...] = ("cpu", "memory", "swap", "disk", "network")
+
+# Recent get_system_stats results keyed by section tuple, as (time, stats);
+# reused while younger than system_stats_ttl
+_stats_cache: dict[tuple[str, ...], tuple[float, dict[str, Any]]] = {}
+
+
+def _copy_stats(stats: dict[str, Any]) -> dict[str, Any]:
+    """Copy a stats dict and its nested section dicts.
+
+    Callers get their own copy so mutating a result can't change what later
+    callers read from the cache.
+    """
+    return {
+        key: _copy_stats(value) if isinstance(value, dict) else value
+        for key, value in stats.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _current_process(pid: int) -> "psutil.Process":
+    """Get the shared psutil.Process for this server's own pid.
+
+    Keyed on the pid so a forked child doesn't reuse its parent's handle.
+    """
+    import psutil
+
+    return psutil.Process(pid)
+
+
+@lru_cache(maxsize=256)
+def _local_isoformat(timestamp: float) -> str:
+    """Format a POSIX timestamp as a local ISO 8601 string.
+
+    Process create times never change, so repeated lookups of the same
+    process reuse the formatted string.
+    """
+    return datetime.fromtimestamp(timestamp).isoformat()
+
 
 def get_process_info(pid: int | None = None) -> dict[str, Any]:
     """Get information about system processes.
@@ -23,156 +128,267 @@ def get_process_info(pid: int | None = None) -> dict[str, Any]:
     Returns:
         Dictionary containing process information
     """
-    try:
-        if pid is None:
-            process = psutil.Process()
-        else:
-            process = psutil.Process(pid)
-
-        info = {
-            "pid": process.pid,
-            "name": process.name(),
-            "status": process.status(),
-            "cpu_percent": process.cpu_percent(),
-            "memory_info": {
-                "rss": process.memory_info().rss,
-                "vms": process.memory_info().vms,
-            },
-            "create_time": datetime.fromtimestamp(process.create_time()).isoformat(),
-            "num_threads": process.num_threads(),
-        }
-
-        logger.info("Process info retrieved", pid=process.pid)
+    import psutil
+
+    with _tool_errors("get process info", pid=pid):
+        try:
+            if pid is None:
+                process = _current_process(os.getpid())
+            else:
+                process = psutil.Process(pid)
+
+            # oneshot() lets psutil share each /proc read across the attributes
+            with process.oneshot():
+                memory_info = process.memory_info()
+                info = {
+                    "pid": process.pid,
+                    "name": process.name(),
+                    "status": process.status(),
+                    "cpu_percent": process.cpu_percent(),
+                    "memory_info": {
+                        "rss": memory_info.rss,
+                        "vms": memory_info.vms,
+                    },
+                    "create_time": _local_isoformat(process.create_time()),
+                    "num_threads": process.num_threads(),
+                }
+        except psutil.NoSuchProcess:
+            raise ValidationError(f"Process with PID {pid} not found", field="pid")
+
+        logger.debug("Process info retrieved", pid=process.pid)
         return info
 
-    except psutil.NoSuchProcess:
-        raise ValidationError(f"Process with PID {pid} not found", field="pid")
-    except Exception as e:
-        logger.error("Error getting process info", pid=pid, error=str(e))
-        raise MacroManError(f"Failed to get process info: {e!s}")
 
-
-def get_system_stats() -> dict[str, Any]:
+def get_system_stats(fields: list[str] | None = None) -> dict[str, Any]:
     """Get comprehensive system statistics.
 
+    Results are cached for ``system_stats_ttl`` seconds (0.5 by default) so
+    clients polling rapidly don't re-read every counter on each call.
+
+    Args:
+        fields: Sections to include, any of "cpu", "memory", "swap", "disk"
+            and "network". All sections are included if None; sections not
+            requested are not read at all.
+
     Returns:
         Dictionary containing system statistics
     """
-    try:
-        # CPU information
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_count = psutil.cpu_count()
-        cpu_freq = psutil.cpu_freq()
-
-        # Memory information
-        memory = psutil.virtual_memory()
-        swap = psutil.swap_memory()
-
-        # Disk information
-        disk = psutil.disk_usage("/")
-
-        # Network information
-        network = psutil.net_io_counters()
-
-        stats = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "cpu": {
-                "percent": cpu_percent,
-                "count": cpu_count,
+    if fields is None:
+        sections = _STATS_SECTIONS
+    else:
+        unknown = set(fields).difference(_STATS_SECTIONS)
+        if unknown:
+            raise ValidationError(
+                f"Unknown system stats fields: {', '.join(sorted(unknown))}",
+                field="fields",
+            )
+        sections = tuple(name for name in _STATS_SECTIONS if name in fields)
+
+    now = time.monotonic()
+    cached = _stats_cache.get(sections)
+    if cached is not None and now - cached[0] < get_settings().system_stats_ttl:
+        return _copy_stats(cached[1])
+
+    import psutil
+
+    with _tool_errors("get system stats"):
+        stats: dict[str, Any] = {"timestamp": datetime.now(timezone.utc).isoformat()}
+
+        if "cpu" in sections:
+            cpu_freq = psutil.cpu_freq()
+            stats["cpu"] = {
+                "percent": _cpu_percent(),
+                "count": _cpu_count(),
                 "frequency": {
                     "current": cpu_freq.current if cpu_freq else None,
                     "min": cpu_freq.min if cpu_freq else None,
                     "max": cpu_freq.max if cpu_freq else None,
                 },
-            },
-            "memory": {
+            }
+
+        if "memory" in sections:
+            memory = psutil.virtual_memory()
+            stats["memory"] = {
                 "total": memory.total,
                 "available": memory.available,
                 "percent": memory.percent,
                 "used": memory.used,
                 "free": memory.free,
-            },
-            "swap": {
+            }
+
+        if "swap" in sections:
+            swap = psutil.swap_memory()
+            stats["swap"] = {
                 "total": swap.total,
                 "used": swap.used,
                 "free": swap.free,
                 "percent": swap.percent,
-            },
-            "disk": {
+            }
+
+        if "disk" in sections:
+            disk = psutil.disk_usage("/")
+            stats["disk"] = {
                 "total": disk.total,
                 "used": disk.used,
                 "free": disk.free,
                 "percent": (disk.used / disk.total) * 100,
-            },
-            "network": {
+            }
+
+        if "network" in sections:
+            network = psutil.net_io_counters()
+            stats["network"] = {
                 "bytes_sent": network.bytes_sent,
                 "bytes_recv": network.bytes_recv,
                 "packets_sent": network.packets_sent,
                 "packets_recv": network.packets_recv,
-            },
-        }
+            }
 
-        logger.info("System stats retrieved")
-        return stats
+        _stats_cache[sections] = (now, stats)
+        logger.debug("System stats retrieved", fields=sections)
+        return _copy_stats(stats)
 
-    except Exception as e:
-        logger.error("Error getting system stats", error=str(e))
-        raise MacroManError(f"Failed to get system stats: {e!s}")
+
+# Maximum bytes of stdout/stderr kept per command; the child is killed once
+# either stream exceeds it so runaway output can't exhaust server memory
+_MAX_OUTPUT_BYTES = 1 << 20
+
+
+class _OutputReader(threading.Thread):
+    """Read a child's output stream, keeping at most _MAX_OUTPUT_BYTES."""
+
+    def __init__(self, stream, process: subprocess.Popen) -> None:
+        super().__init__(daemon=True)
+        self.stream = stream
+        self.process = process
+        self.chunks: list[bytes] = []
+        self.truncated = False
+
+    def run(self) -> None:
+        remaining = _MAX_OUTPUT_BYTES
+        while chunk := self.stream.read1(65536):
+            if len(chunk) > remaining:
+                self.chunks.append(chunk[:remaining])
+                self.truncated = True
+                self.process.kill()
+                return
+            self.chunks.append(chunk)
+            remaining -= len(chunk)
+
+    def text(self) -> str:
+        return b"".join(self.chunks).decode("utf-8", errors="replace")
 
 
-def execute_command(command: str, timeout: int = 30) -> dict[str, Any]:
+def _run_bounded(args: str | list[str], shell: bool, timeout: int) -> dict[str, Any]:
+    """Run a command and capture its output, truncated to _MAX_OUTPUT_BYTES.
+
+    Output is collected as bytes and decoded once the command has finished.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout
+    """
+    with subprocess.Popen(
+        args,
+        shell=shell,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=os.getcwd(),
+    ) as process:
+        stdout = _OutputReader(process.stdout, process)
+        stderr = _OutputReader(process.stderr, process)
+        stdout.start()
+        stderr.start()
+        try:
+            return_code = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise
+        finally:
+            stdout.join()
+            stderr.join()
+
+    return {
+        "return_code": return_code,
+        "stdout": stdout.text(),
+        "stderr": stderr.text(),
+        "stdout_truncated": stdout.truncated,
+        "stderr_truncated": stderr.truncated,
+    }
+
+
+def execute_command(
+    command: str, timeout: int = 30, use_shell: bool = False
+) -> dict[str, Any]:
     """Execute a system command safely.
 
+    By default the command is split with shlex and run directly, without a
+    shell. Pass use_shell=True when it needs shell features such as pipes,
+    redirection or variable expansion. At most 1 MiB of stdout and of stderr
+    is kept; a command that writes more is killed and its output flagged as
+    truncated.
+
     Args:
         command: The command to execute
         timeout: Timeout in seconds for command execution
+        use_shell: Whether to run the command through /bin/sh
 
     Returns:
         Dictionary containing command execution results
     """
-    try:
+    with _tool_errors("execute command", command=command):
         if not command or not command.strip():
             raise ValidationError("Command cannot be empty", field="command")
 
         # Basic security check - prevent dangerous commands
-        dangerous_commands = ["rm -rf", "sudo", "su", "chmod 777", "dd if=", "mkfs"]
-        if any(dangerous in command.lower() for dangerous in dangerous_commands):
+        if _DANGEROUS_COMMAND_RE.search(command):
             raise ValidationError(
                 "Command contains potentially dangerous operations", field="command"
             )
 
+        if use_shell:
+            args: str | list[str] = command
+        else:
+            try:
+                args = shlex.split(command)
+            except ValueError as e:
+                raise ValidationError(
+                    f"Could not parse command: {e!s}", field="command"
+                )
+
         logger.info("Executing command", command=command, timeout=timeout)
 
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=os.getcwd(),
-        )
+        try:
+            output = _run_bounded(args, use_shell, timeout)
+        except subprocess.TimeoutExpired:
+            logger.error("Command timeout", command=command, timeout=timeout)
+            raise MacroManError(f"Command timed out after {timeout} seconds")
+        except FileNotFoundError as e:
+            # Report a missing program the way a shell would. With a shell,
+            # /bin/sh already does that, so any FileNotFoundError is real.
+            if use_shell or e.filename != args[0]:
+                raise
+            output = {
+                "return_code": 127,
+                "stdout": "",
+                "stderr": f"{args[0]}: command not found",
+                "stdout_truncated": False,
+                "stderr_truncated": False,
+            }
 
         response = {
             "command": command,
-            "return_code": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "success": result.returncode == 0,
+            **output,
+            "success": output["return_code"] == 0,
         }
 
-        logger.info("Command executed", **response)
+        # Keep stdout/stderr out of the log record; they can be up to 1 MiB each
+        logger.debug(
+            "Command executed",
+            command=command,
+            return_code=response["return_code"],
+            success=response["success"],
+        )
         return response
 
-    except subprocess.TimeoutExpired:
-        logger.error("Command timeout", command=command, timeout=timeout)
-        raise MacroManError(f"Command timed out after {timeout} seconds")
-    except (ValidationError, subprocess.TimeoutExpired):
-        # Re-raise validation errors and timeout errors as-is
-        raise
-    except Exception as e:
-        logger.error("Error executing command", command=command, error=str(e))
-        raise MacroManError(f"Failed to execute command: {e!s}")
-
 
 def get_environment_variables(prefix: str | None = None) -> dict[str, str]:
     """Get environment variables.
@@ -183,51 +399,60 @@ def get_environment_variables(prefix: str | None = None) -> dict[str, str]:
     Returns:
         Dictionary of environment variables
     """
-    try:
-        env_vars = dict(os.environ)
-
+    with _tool_errors("get environment variables"):
         if prefix:
             env_vars = {
-                key: value for key, value in env_vars.items() if key.startswith(prefix)
+                key: value
+                for key, value in os.environ.items()
+                if key.startswith(prefix)
             }
+        else:
+            env_vars = dict(os.environ)
 
-        logger.info(
+        logger.debug(
             "Environment variables retrieved", prefix=prefix, count=len(env_vars)
         )
         return env_vars
 
-    except Exception as e:
-        logger.error("Error getting environment variables", error=str(e))
-        raise MacroManError(f"Failed to get environment variables: {e!s}")
+
+@lru_cache
+def _static_python_info() -> dict[str, Any]:
+    """Get Python runtime details that don't change while the process runs."""
+    return {
+        "version": sys.version,
+        "version_info": {
+            "major": sys.version_info.major,
+            "minor": sys.version_info.minor,
+            "micro": sys.version_info.micro,
+        },
+        "executable": sys.executable,
+        "platform": sys.platform,
+    }
 
 
-def get_python_info() -> dict[str, Any]:
+def get_python_info(include_path: bool = False) -> dict[str, Any]:
     """Get Python runtime information.
 
+    Args:
+        include_path: Whether to include a snapshot of sys.path
+
     Returns:
         Dictionary containing Python information
     """
-    try:
+    with _tool_errors("get Python info"):
+        static = _static_python_info()
+        # Copy the nested dict too so callers can't mutate the cached one
         info = {
-            "version": sys.version,
-            "version_info": {
-                "major": sys.version_info.major,
-                "minor": sys.version_info.minor,
-                "micro": sys.version_info.micro,
-            },
-            "executable": sys.executable,
-            "platform": sys.platform,
-            "path": sys.path,
+            **static,
+            "version_info": dict(static["version_info"]),
             "modules_count": len(sys.modules),
         }
+        if include_path:
+            info["path"] = list(sys.path)
 
-        logger.info("Python info retrieved")
+        logger.debug("Python info retrieved")
         return info
 
-    except Exception as e:
-        logger.error("Error getting Python info", error=str(e))
-        raise MacroManError(f"Failed to get Python info: {e!s}")
-
 
 def register_system_tools(mcp_server) -> None:
     """Register system utility tools."""
@@ -237,17 +462,19 @@ def register_system_tools(mcp_server) -> None:
         return get_process_info(pid)
 
     @mcp_server.tool()
-    def _get_system_stats() -> dict[str, Any]:
-        return get_system_stats()
+    def _get_system_stats(fields: list[str] | None = None) -> dict[str, Any]:
+        return get_system_stats(fields)
 
     @mcp_server.tool()
-    def _execute_command(command: str, timeout: int = 30) -> dict[str, Any]:
-        return execute_command(command, timeout)
+    def _execute_command(
+        command: str, timeout: int = 30, use_shell: bool = False
+    ) -> dict[str, Any]:
+        return execute_command(command, timeout, use_shell)
 
     @mcp_server.tool()
     def _get_environment_variables(prefix: str | None = None) -> dict[str, str]:
         return get_environment_variables(prefix)
 
     @mcp_server.tool()
-    def _get_python_info() -> dict[str, Any]:
-        return get_python_info()
+    def _get_python_info(include_path: bool = False) -> dict[str, Any]:
+        return get_python_info(include_path)
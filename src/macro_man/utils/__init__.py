@@ -2,5 +2,12 @@
 
 from .exceptions import AuthenticationError, MacroManError, ValidationError
 from .logging import setup_logging
+from .validation import is_valid_email
 
-__all__ = ["AuthenticationError", "MacroManError", "ValidationError", "setup_logging"]
+__all__ = [
+    "AuthenticationError",
+    "MacroManError",
+    "ValidationError",
+    "is_valid_email",
+    "setup_logging",
+]
@@ -1,7 +1,9 @@
 """Logging configuration for Macro-Man MCP Server."""
 
 import logging
+from typing import Any
 
+import orjson
 import structlog
 from rich.console import Console
 from rich.logging import RichHandler
@@ -9,6 +11,14 @@ from rich.logging import RichHandler
 from ..config import get_settings
 
 
+def _dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer.
+
+    The stdlib logging handlers expect text, so the bytes are decoded.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+
+
 def setup_logging(log_level: str | None = None) -> None:
     """Set up structured logging with rich console output."""
     settings = get_settings()
@@ -25,7 +35,7 @@ def setup_logging(log_level: str | None = None) -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_dumps)
             if not settings.debug
             else structlog.dev.ConsoleRenderer(),
         ],
@@ -0,0 +1,120 @@
+"""HTTP transport shared by the email and calendar tools."""
+
+import asyncio
+import atexit
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any
+
+import httpx
+import orjson
+
+from macro_man.config.settings import get_settings
+from macro_man.utils.exceptions import MacroManError
+
+_TIMEOUT = 30.0
+_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize a tool result as indented JSON."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+@lru_cache
+def get_client() -> httpx.Client:
+    """Get the shared HTTP client for the external service.
+
+    The email and calendar tools both use this client, so they share one
+    connection pool. It negotiates HTTP/2 when the service is reached over
+    TLS.
+    """
+    settings = get_settings()
+    client = httpx.Client(
+        base_url=settings.email_service_url,
+        http2=True,
+        headers={"Content-Type": "application/json"},
+        timeout=_TIMEOUT,
+        limits=_LIMITS,
+    )
+    atexit.register(client.close)
+    return client
+
+
+# Async clients keyed by the event loop that created them. An AsyncClient's
+# connection pool is bound to one loop, so each loop gets its own client.
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for the running event loop.
+
+    Must be called from a coroutine. The client is closed by
+    ``aclose_async_client`` when the server shuts down.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        settings = get_settings()
+        client = httpx.AsyncClient(
+            base_url=settings.email_service_url,
+            http2=True,
+            headers={"Content-Type": "application/json"},
+            timeout=_TIMEOUT,
+            limits=_LIMITS,
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the running event loop's async client, if one was created."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def service_result(response: httpx.Response, label: str) -> dict[str, Any]:
+    """Return the JSON body of a successful response or raise a MacroManError.
+
+    The body is read once and parsed with orjson, on both the success and the
+    error path.
+    """
+    content = response.content
+    if response.status_code == 200:
+        return orjson.loads(content)
+
+    error_msg = f"{label} returned status {response.status_code}"
+    try:
+        error_detail = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        error_msg += f": {content.decode(errors='replace')}"
+    else:
+        if isinstance(error_detail, dict) and "message" in error_detail:
+            error_msg += f": {error_detail['message']}"
+
+    raise MacroManError(error_msg)
+
+
+@contextmanager
+def service_errors(label: str, service: str) -> Iterator[None]:
+    """Translate errors raised while calling the external service.
+
+    Args:
+        label: Name used in timeout and request error messages
+        service: Short service name used in the connection error message
+    """
+    try:
+        yield
+    except httpx.TimeoutException:
+        raise MacroManError(f"{label} request timed out")
+    except httpx.ConnectError:
+        raise MacroManError(f"Could not connect to {service} service at localhost:3000")
+    except httpx.RequestError as e:
+        raise MacroManError(f"{label} request failed: {e!s}")
+    except Exception as e:
+        raise MacroManError(f"Unexpected error calling {label.lower()}: {e!s}")
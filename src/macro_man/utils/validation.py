@@ -0,0 +1,23 @@
+"""Input validation helpers for Macro-Man MCP Server."""
+
+import string
+
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+
+
+def is_valid_email(email: str) -> bool:
+    """Check an email address with a single linear scan.
+
+    Accepts the same addresses as the pattern
+    ``[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}`` without the
+    backtracking cost of a regex.
+    """
+    local, sep, domain = email.partition("@")
+    if not sep or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+    if not _EMAIL_DOMAIN_CHARS.issuperset(domain):
+        return False
+    dot = domain.rfind(".")
+    tld = domain[dot + 1 :]
+    return dot > 0 and len(tld) >= 2 and tld.isascii() and tld.isalpha()
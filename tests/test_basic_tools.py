@@ -1,14 +1,7 @@
 """Tests for basic MCP tools."""
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Add src to Python path for testing
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 from macro_man.utils.exceptions import ValidationError
 
 
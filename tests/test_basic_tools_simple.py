@@ -1,20 +1,13 @@
 """Simple tests for basic MCP tools."""
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Add src to Python path for testing
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+import macro_man.tools.basic as basic_module
+from macro_man.utils.exceptions import ValidationError
 
 
 def test_add_numbers():
     """Test adding two numbers."""
-    # Import the function directly from the module
-    import macro_man.tools.basic as basic_module
-
     # Test the add_numbers function
     result = basic_module.add_numbers(5, 3)
     assert result == 8
@@ -28,8 +21,6 @@ def test_add_numbers():
 
 def test_multiply_numbers():
     """Test multiplying two numbers."""
-    import macro_man.tools.basic as basic_module
-
     result = basic_module.multiply_numbers(4, 5)
     assert result == 20
 
@@ -42,8 +33,6 @@ def test_multiply_numbers():
 
 def test_greet_user():
     """Test greeting a user."""
-    import macro_man.tools.basic as basic_module
-
     result = basic_module.greet_user("Alice")
     assert result == "Hello, Alice! Nice to meet you."
 
@@ -53,9 +42,6 @@ def test_greet_user():
 
 def test_greet_user_empty_name():
     """Test greeting with empty name raises validation error."""
-    import macro_man.tools.basic as basic_module
-    from macro_man.utils.exceptions import ValidationError
-
     with pytest.raises(ValidationError) as exc_info:
         basic_module.greet_user("")
 
@@ -65,8 +51,6 @@ def test_greet_user_empty_name():
 
 def test_echo_message():
     """Test echoing a message."""
-    import macro_man.tools.basic as basic_module
-
     result = basic_module.echo_message("Hello World")
     assert result == "Echo: Hello World"
 
@@ -76,9 +60,6 @@ def test_echo_message():
 
 def test_echo_message_empty():
     """Test echoing empty message raises validation error."""
-    import macro_man.tools.basic as basic_module
-    from macro_man.utils.exceptions import ValidationError
-
     with pytest.raises(ValidationError) as exc_info:
         basic_module.echo_message("")
 
@@ -88,8 +69,6 @@ def test_echo_message_empty():
 
 def test_get_system_info():
     """Test getting system information."""
-    import macro_man.tools.basic as basic_module
-
     info = basic_module.get_system_info()
 
     assert isinstance(info, dict)
@@ -1,109 +1,140 @@
 """Tests for calendar scheduling tool."""
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
 
-# Add src to Python path for testing
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 from macro_man.config.settings import get_settings
 from macro_man.tools.calendar import (
     _list_events_via_service,
     _schedule_meet_via_service,
+    _validate_emails,
+    _validate_emails_cached,
     list_events,
+    list_events_async,
     schedule_meet,
+    schedule_meet_async,
 )
 from macro_man.utils.exceptions import MacroManError, ValidationError
+from macro_man.utils.service import get_client
+
+# Request payloads shared by the service tests; the helpers don't mutate them
+_MEET_PAYLOAD = {
+    "title": "Design sync",
+    "start": "2025-10-21T10:00:00Z",
+    "end": "2025-10-21T10:30:00Z",
+    "attendees": ["user@example.com"],
+}
+_LIST_PAYLOAD = {
+    "timeMin": "2025-10-20T00:00:00Z",
+    "timeMax": "2025-10-27T23:59:59Z",
+    "maxResults": 10,
+    "q": "meeting",
+}
+
+# Transport failures and the message each one should surface
+_TRANSPORT_ERRORS = [
+    (httpx.TimeoutException("timeout"), "timed out"),
+    (httpx.ConnectError("connect"), "could not connect"),
+    (httpx.RequestError("boom"), "request failed"),
+]
+
+
+@pytest.fixture
+def mock_post(monkeypatch):
+    """Replace the shared service client and return its ``post`` mock."""
+    client = MagicMock()
+    monkeypatch.setattr("macro_man.tools.calendar.get_client", lambda: client)
+    return client.post
+
+
+@pytest.fixture
+def mock_schedule_service(monkeypatch):
+    """Stub out the schedule-meet service call."""
+    service = MagicMock()
+    monkeypatch.setattr("macro_man.tools.calendar._schedule_meet_via_service", service)
+    return service
+
+
+@pytest.fixture
+def mock_list_service(monkeypatch):
+    """Stub out the list-events service call."""
+    service = MagicMock()
+    monkeypatch.setattr("macro_man.tools.calendar._list_events_via_service", service)
+    return service
+
+
+def _response(status_code, body):
+    """Build a minimal stand-in for an httpx response."""
+    return SimpleNamespace(status_code=status_code, content=orjson.dumps(body))
+
+
+class TestClient:
+    def test_client_is_shared(self):
+        client = get_client()
+        assert client is get_client()
+        assert str(client.base_url).rstrip("/") == get_settings().email_service_url
 
 
 class TestScheduleMeetViaService:
-    @patch("macro_man.tools.calendar.httpx.post")
     def test_service_success(self, mock_post):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "id": "abc",
-            "status": "confirmed",
-            "meetLink": "https://meet.google.com/xyz",
-        }
+        mock_response = _response(
+            200,
+            {
+                "success": True,
+                "id": "abc",
+                "status": "confirmed",
+                "meetLink": "https://meet.google.com/xyz",
+            },
+        )
         mock_post.return_value = mock_response
 
-        payload = {
-            "title": "Design sync",
-            "start": "2025-10-21T10:00:00Z",
-            "end": "2025-10-21T10:30:00Z",
-            "attendees": ["user@example.com"],
-        }
-
-        result = _schedule_meet_via_service(payload)
+        result = _schedule_meet_via_service(_MEET_PAYLOAD)
         assert result["success"] is True
         assert result["id"] == "abc"
 
-        settings = get_settings()
-        expected_url = f"{settings.email_service_url}/schedule-meet"
-        mock_post.assert_called_once_with(
-            expected_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30.0,
-        )
+        mock_post.assert_called_once_with("/schedule-meet", json=_MEET_PAYLOAD)
 
-    @patch("macro_man.tools.calendar.httpx.post")
     def test_service_http_error(self, mock_post):
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.json.return_value = {"message": "Internal error"}
+        mock_response = _response(500, {"message": "Internal error"})
         mock_post.return_value = mock_response
 
         with pytest.raises(MacroManError) as exc:
-            _schedule_meet_via_service(
-                {
-                    "title": "X",
-                    "start": "2025-01-01T00:00:00Z",
-                    "end": "2025-01-01T00:30:00Z",
-                }
-            )
+            _schedule_meet_via_service(_MEET_PAYLOAD)
 
         assert "returned status 500" in str(exc.value)
         assert "Internal error" in str(exc.value)
 
-    @patch("macro_man.tools.calendar.httpx.post")
-    def test_service_timeout(self, mock_post):
-        import httpx
-
-        mock_post.side_effect = httpx.TimeoutException("timeout")
+    @pytest.mark.parametrize(("error", "expected"), _TRANSPORT_ERRORS)
+    def test_service_transport_error(self, mock_post, error, expected):
+        mock_post.side_effect = error
         with pytest.raises(MacroManError) as exc:
             _schedule_meet_via_service({})
-        assert "timed out" in str(exc.value).lower()
+        assert expected in str(exc.value).lower()
 
-    @patch("macro_man.tools.calendar.httpx.post")
-    def test_service_connect_error(self, mock_post):
-        import httpx
 
-        mock_post.side_effect = httpx.ConnectError("connect")
-        with pytest.raises(MacroManError) as exc:
-            _schedule_meet_via_service({})
-        assert "could not connect" in str(exc.value).lower()
+class TestValidateEmails:
+    def test_validate_emails_cached(self):
+        _validate_emails_cached.cache_clear()
+        attendees = [" a@example.com ", "b@example.com"]
 
-    @patch("macro_man.tools.calendar.httpx.post")
-    def test_service_request_error(self, mock_post):
-        import httpx
+        assert _validate_emails(attendees) == ["a@example.com", "b@example.com"]
+        assert _validate_emails(attendees) == ["a@example.com", "b@example.com"]
+        assert _validate_emails_cached.cache_info().hits == 1
 
-        mock_post.side_effect = httpx.RequestError("boom")
-        with pytest.raises(MacroManError) as exc:
-            _schedule_meet_via_service({})
-        assert "request failed" in str(exc.value).lower()
+    def test_validate_emails_non_string(self):
+        with pytest.raises(ValidationError) as exc:
+            _validate_emails(["a@example.com", 123])  # type: ignore[list-item]
+        assert exc.value.field == "attendees"
 
 
 class TestScheduleMeet:
-    @patch("macro_man.tools.calendar._schedule_meet_via_service")
-    def test_schedule_meet_success(self, mock_service):
-        mock_service.return_value = {
+    def test_schedule_meet_success(self, mock_schedule_service):
+        mock_schedule_service.return_value = {
             "success": True,
             "id": "abc",
             "status": "confirmed",
@@ -121,8 +152,8 @@ class TestScheduleMeet:
         )
 
         assert result["success"] is True
-        mock_service.assert_called_once()
-        called_payload = mock_service.call_args.args[0]
+        mock_schedule_service.assert_called_once()
+        called_payload = mock_schedule_service.call_args.args[0]
         assert called_payload["title"] == "Design sync"
         assert called_payload["description"] == "Review MCP server changes"
         assert called_payload["start"] == "2025-10-21T10:00:00Z"
@@ -141,46 +172,49 @@ class TestScheduleMeet:
             )
         assert exc.value.field == "title"
 
-    def test_schedule_meet_invalid_datetime_format(self):
+    @pytest.mark.parametrize(
+        ("field", "start", "end"),
+        [
+            ("start", "2025-10-21 10:00:00", "2025-10-21T10:30:00Z"),  # missing TZ
+            ("end", "2025-10-21T10:00:00Z", "2025-10-21 10:30:00"),  # missing TZ
+            ("start", "2025-13-21T10:00:00Z", "2025-10-21T10:30:00Z"),  # bad month
+            ("start", "2025-W43-2T10:00:00Z", "2025-10-21T10:30:00Z"),  # week date
+            ("start", "2025-10-21T10Z", "2025-10-21T10:30:00Z"),  # hour only
+            ("end", "2025-10-21T10:00:00Z", "2025-10-21T10:30Z"),  # no seconds
+            ("start", "2025-10-21T10:00:00+0530", "2025-10-21T10:30:00Z"),  # compact
+            ("end", "2025-10-21T10:00:00Z", "2025-10-21T10:30:00.5Z"),  # fraction
+        ],
+    )
+    def test_schedule_meet_invalid_datetime(self, field, start, end):
         with pytest.raises(ValidationError) as exc:
-            schedule_meet(
-                title="Design",
-                description=None,
-                start="2025-10-21 10:00:00",  # missing TZ
-                end="2025-10-21T10:30:00Z",
-            )
-        assert exc.value.field == "start"
+            schedule_meet(title="Design", description=None, start=start, end=end)
+        assert exc.value.field == field
 
-        with pytest.raises(ValidationError) as exc2:
-            schedule_meet(
-                title="Design",
-                description=None,
-                start="2025-10-21T10:00:00Z",
-                end="2025-10-21 10:30:00",
-            )
-        assert exc2.value.field == "end"
+    def test_schedule_meet_accepts_utc_offset(self, mock_schedule_service):
+        mock_schedule_service.return_value = {"success": True}
 
-    def test_schedule_meet_invalid_attendees(self):
+        schedule_meet(
+            title="Design",
+            description=None,
+            start="2025-10-21T10:00:00+05:30",
+            end="2025-10-21T10:30:00-04:00",
+        )
+
+        called_payload = mock_schedule_service.call_args.args[0]
+        assert called_payload["start"] == "2025-10-21T10:00:00+05:30"
+
+    @pytest.mark.parametrize("attendees", [[], ["invalid"]])
+    def test_schedule_meet_invalid_attendees(self, attendees):
         with pytest.raises(ValidationError) as exc:
             schedule_meet(
                 title="Design",
                 description=None,
                 start="2025-10-21T10:00:00Z",
                 end="2025-10-21T10:30:00Z",
-                attendees=[],
+                attendees=attendees,
             )
         assert exc.value.field == "attendees"
 
-        with pytest.raises(ValidationError) as exc2:
-            schedule_meet(
-                title="Design",
-                description=None,
-                start="2025-10-21T10:00:00Z",
-                end="2025-10-21T10:30:00Z",
-                attendees=["invalid"],
-            )
-        assert exc2.value.field == "attendees"
-
     def test_schedule_meet_invalid_send_updates(self):
         with pytest.raises(ValidationError) as exc:
             schedule_meet(
@@ -194,95 +228,52 @@ class TestScheduleMeet:
 
 
 class TestListEventsViaService:
-    @patch("macro_man.tools.calendar.httpx.post")
     def test_service_success(self, mock_post):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "events": [
-                {
-                    "id": "event1",
-                    "summary": "Team Meeting",
-                    "start": {"dateTime": "2025-10-21T10:00:00Z"},
-                    "end": {"dateTime": "2025-10-21T11:00:00Z"},
-                }
-            ],
-            "total": 1,
-        }
+        mock_response = _response(
+            200,
+            {
+                "success": True,
+                "events": [
+                    {
+                        "id": "event1",
+                        "summary": "Team Meeting",
+                        "start": {"dateTime": "2025-10-21T10:00:00Z"},
+                        "end": {"dateTime": "2025-10-21T11:00:00Z"},
+                    }
+                ],
+                "total": 1,
+            },
+        )
         mock_post.return_value = mock_response
 
-        payload = {
-            "timeMin": "2025-10-20T00:00:00Z",
-            "timeMax": "2025-10-27T23:59:59Z",
-            "maxResults": 10,
-            "q": "meeting",
-        }
-
-        result = _list_events_via_service(payload)
+        result = _list_events_via_service(_LIST_PAYLOAD)
         assert result["success"] is True
         assert result["total"] == 1
         assert len(result["events"]) == 1
 
-        settings = get_settings()
-        expected_url = f"{settings.email_service_url}/list-events"
-        mock_post.assert_called_once_with(
-            expected_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30.0,
-        )
+        mock_post.assert_called_once_with("/list-events", json=_LIST_PAYLOAD)
 
-    @patch("macro_man.tools.calendar.httpx.post")
     def test_service_http_error(self, mock_post):
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {"message": "Invalid time range"}
+        mock_response = _response(400, {"message": "Invalid time range"})
         mock_post.return_value = mock_response
 
         with pytest.raises(MacroManError) as exc:
-            _list_events_via_service(
-                {
-                    "timeMin": "2025-10-20T00:00:00Z",
-                    "timeMax": "2025-10-27T23:59:59Z",
-                }
-            )
+            _list_events_via_service(_LIST_PAYLOAD)
 
         assert "returned status 400" in str(exc.value)
         assert "Invalid time range" in str(exc.value)
 
-    @patch("macro_man.tools.calendar.httpx.post")
-    def test_service_timeout(self, mock_post):
-        import httpx
-
-        mock_post.side_effect = httpx.TimeoutException("timeout")
+    @pytest.mark.parametrize(("error", "expected"), _TRANSPORT_ERRORS)
+    def test_service_transport_error(self, mock_post, error, expected):
+        mock_post.side_effect = error
         with pytest.raises(MacroManError) as exc:
             _list_events_via_service({})
-        assert "timed out" in str(exc.value).lower()
-
-    @patch("macro_man.tools.calendar.httpx.post")
-    def test_service_connect_error(self, mock_post):
-        import httpx
-
-        mock_post.side_effect = httpx.ConnectError("connect")
-        with pytest.raises(MacroManError) as exc:
-            _list_events_via_service({})
-        assert "could not connect" in str(exc.value).lower()
-
-    @patch("macro_man.tools.calendar.httpx.post")
-    def test_service_request_error(self, mock_post):
-        import httpx
-
-        mock_post.side_effect = httpx.RequestError("boom")
-        with pytest.raises(MacroManError) as exc:
-            _list_events_via_service({})
-        assert "request failed" in str(exc.value).lower()
+        assert expected in str(exc.value).lower()
 
 
 class TestListEvents:
-    @patch("macro_man.tools.calendar._list_events_via_service")
-    def test_list_events_success(self, mock_service):
-        mock_service.return_value = {
+    def test_list_events_success(self, mock_list_service):
+        mock_list_service.return_value = {
             "success": True,
             "events": [
                 {
@@ -303,16 +294,15 @@ class TestListEvents:
         )
 
         assert result["success"] is True
-        mock_service.assert_called_once()
-        called_payload = mock_service.call_args.args[0]
+        mock_list_service.assert_called_once()
+        called_payload = mock_list_service.call_args.args[0]
         assert called_payload["timeMin"] == "2025-10-20T00:00:00Z"
         assert called_payload["timeMax"] == "2025-10-27T23:59:59Z"
         assert called_payload["maxResults"] == 10
         assert called_payload["q"] == "meeting"
 
-    @patch("macro_man.tools.calendar._list_events_via_service")
-    def test_list_events_minimal_params(self, mock_service):
-        mock_service.return_value = {"success": True, "events": [], "total": 0}
+    def test_list_events_minimal_params(self, mock_list_service):
+        mock_list_service.return_value = {"success": True, "events": [], "total": 0}
 
         result = list_events(
             timeMin="2025-10-20T00:00:00Z",
@@ -320,7 +310,7 @@ class TestListEvents:
         )
 
         assert result["success"] is True
-        called_payload = mock_service.call_args.args[0]
+        called_payload = mock_list_service.call_args.args[0]
         assert "timeMin" in called_payload
         assert "timeMax" in called_payload
         assert "maxResults" not in called_payload
@@ -342,41 +332,30 @@ class TestListEvents:
             )
         assert exc.value.field == "timeMax"
 
-    def test_list_events_invalid_time_format(self):
+    @pytest.mark.parametrize(
+        ("field", "time_min", "time_max"),
+        [
+            ("timeMin", "2025-10-20 00:00:00", "2025-10-27T23:59:59Z"),  # missing TZ
+            ("timeMax", "2025-10-20T00:00:00Z", "2025-10-27 23:59:59"),  # missing TZ
+        ],
+    )
+    def test_list_events_invalid_time_format(self, field, time_min, time_max):
         with pytest.raises(ValidationError) as exc:
-            list_events(
-                timeMin="2025-10-20 00:00:00",  # missing TZ
-                timeMax="2025-10-27T23:59:59Z",
-            )
-        assert exc.value.field == "timeMin"
+            list_events(timeMin=time_min, timeMax=time_max)
+        assert exc.value.field == field
 
-        with pytest.raises(ValidationError) as exc2:
-            list_events(
-                timeMin="2025-10-20T00:00:00Z",
-                timeMax="2025-10-27 23:59:59",  # missing TZ
-            )
-        assert exc2.value.field == "timeMax"
-
-    def test_list_events_invalid_max_results(self):
+    @pytest.mark.parametrize("max_results", [0, "10"])
+    def test_list_events_invalid_max_results(self, max_results):
         with pytest.raises(ValidationError) as exc:
             list_events(
                 timeMin="2025-10-20T00:00:00Z",
                 timeMax="2025-10-27T23:59:59Z",
-                maxResults=0,  # invalid
+                maxResults=max_results,
             )
         assert exc.value.field == "maxResults"
 
-        with pytest.raises(ValidationError) as exc2:
-            list_events(
-                timeMin="2025-10-20T00:00:00Z",
-                timeMax="2025-10-27T23:59:59Z",
-                maxResults="10",  # type: ignore[arg-type]
-            )
-        assert exc2.value.field == "maxResults"
-
-    @patch("macro_man.tools.calendar._list_events_via_service")
-    def test_list_events_empty_query_ignored(self, mock_service):
-        mock_service.return_value = {"success": True, "events": [], "total": 0}
+    def test_list_events_empty_query_ignored(self, mock_list_service):
+        mock_list_service.return_value = {"success": True, "events": [], "total": 0}
 
         list_events(
             timeMin="2025-10-20T00:00:00Z",
@@ -384,5 +363,47 @@ class TestListEvents:
             q="   ",  # whitespace only
         )
 
-        called_payload = mock_service.call_args.args[0]
+        called_payload = mock_list_service.call_args.args[0]
         assert "q" not in called_payload
+
+
+class TestAsyncCalendar:
+    @patch("macro_man.tools.calendar.get_async_client")
+    def test_schedule_meet_async_success(self, mock_async_client):
+        mock_response = _response(200, {"success": True, "id": "abc"})
+        mock_post = AsyncMock(return_value=mock_response)
+        mock_async_client.return_value.post = mock_post
+
+        result = asyncio.run(
+            schedule_meet_async(
+                title="Design sync",
+                description=None,
+                start="2025-10-21T10:00:00Z",
+                end="2025-10-21T10:30:00Z",
+            )
+        )
+
+        assert result["id"] == "abc"
+        mock_post.assert_awaited_once_with(
+            "/schedule-meet",
+            json={
+                "title": "Design sync",
+                "start": "2025-10-21T10:00:00Z",
+                "end": "2025-10-21T10:30:00Z",
+            },
+        )
+
+    @patch("macro_man.tools.calendar.get_async_client")
+    def test_list_events_async_timeout(self, mock_async_client):
+        mock_async_client.return_value.post = AsyncMock(
+            side_effect=httpx.TimeoutException("timeout")
+        )
+
+        with pytest.raises(MacroManError) as exc:
+            asyncio.run(
+                list_events_async(
+                    timeMin="2025-10-20T00:00:00Z",
+                    timeMax="2025-10-27T23:59:59Z",
+                )
+            )
+        assert "timed out" in str(exc.value).lower()
@@ -1,11 +1,29 @@
 """Unit tests for individual components."""
 
-import sys
-from pathlib import Path
-
-# Add src to Python path for testing
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+import asyncio
+import copy
+import pickle
+
+import orjson
+import pytest
+import structlog
+
+from macro_man.config import get_settings
+from macro_man.core.server import create_mcp_server
+from macro_man.tools import calendar, email
+from macro_man.utils.exceptions import (
+    AuthenticationError,
+    MacroManError,
+    ServiceError,
+    ValidationError,
+)
+from macro_man.utils.logging import _dumps, setup_logging
+from macro_man.utils.service import (
+    aclose_async_client,
+    get_async_client,
+    get_client,
+)
+from macro_man.utils.validation import is_valid_email
 
 
 class TestConfiguration:
@@ -13,8 +31,6 @@ class TestConfiguration:
 
     def test_settings_loading(self):
         """Test that settings can be loaded."""
-        from macro_man.config import get_settings
-
         settings = get_settings()
         assert settings is not None
         assert settings.server_host == "0.0.0.0"
@@ -23,8 +39,6 @@ class TestConfiguration:
 
     def test_settings_caching(self):
         """Test that settings are cached."""
-        from macro_man.config import get_settings
-
         settings1 = get_settings()
         settings2 = get_settings()
 
@@ -37,64 +51,110 @@ class TestExceptions:
 
     def test_macro_man_error(self):
         """Test MacroManError exception."""
-        from macro_man.utils.exceptions import MacroManError
-
         error = MacroManError("Test error", "TEST_ERROR")
         assert str(error) == "Test error"
         assert error.error_code == "TEST_ERROR"
 
     def test_validation_error(self):
         """Test ValidationError exception."""
-        from macro_man.utils.exceptions import ValidationError
-
         error = ValidationError("Invalid input", "input_field")
         assert str(error) == "Invalid input"
         assert error.field == "input_field"
         assert error.error_code == "VALIDATION_ERROR"
 
+    def test_exceptions_survive_copy_and_pickle(self):
+        """Test that custom attributes survive copy and pickle round-trips."""
+        errors = [
+            (MacroManError("x", "CUSTOM"), "error_code", "CUSTOM"),
+            (ValidationError("bad", field="to"), "field", "to"),
+            (ServiceError("down", service="email"), "service", "email"),
+        ]
+        for error, attr, expected in errors:
+            for clone in (copy.copy(error), pickle.loads(pickle.dumps(error))):
+                assert type(clone) is type(error)
+                assert str(clone) == str(error)
+                assert getattr(clone, attr) == expected
+
     def test_authentication_error(self):
         """Test AuthenticationError exception."""
-        from macro_man.utils.exceptions import AuthenticationError
-
         error = AuthenticationError("Auth failed")
         assert str(error) == "Auth failed"
         assert error.error_code == "AUTHENTICATION_ERROR"
 
 
+class TestValidation:
+    """Test input validation helpers."""
+
+    def test_is_valid_email(self):
+        """Test email address validation."""
+        assert is_valid_email("first.last+tag@sub.example.org")
+        assert not is_valid_email("user@example")
+        assert not is_valid_email("user@example.c")
+        assert not is_valid_email("user@@example.com")
+        assert not is_valid_email("user@.com")
+        assert not is_valid_email("us er@example.com")
+
+
 class TestLogging:
     """Test logging configuration."""
 
     def test_logging_setup(self):
         """Test that logging can be set up."""
-        from macro_man.utils.logging import setup_logging
-
         # Should not raise an exception
         setup_logging()
 
         # Test that we can get a logger
-        import structlog
-
         logger = structlog.get_logger(__name__)
         assert logger is not None
 
+    def test_json_renderer_uses_orjson(self):
+        """Test that log events render to JSON text via orjson."""
+        rendered = _dumps({"event": "hello", "count": 1, 2: "two"})
+        assert isinstance(rendered, str)
+        assert orjson.loads(rendered) == {"event": "hello", "count": 1, "2": "two"}
+
+
+class TestService:
+    """Test the shared service transport."""
+
+    def test_tools_share_one_client(self):
+        """Test that the email and calendar tools use the same clients."""
+        assert calendar.get_client is email.get_client is get_client
+        assert calendar.get_async_client is email.get_async_client
+        assert email.get_async_client is get_async_client
+
+    def test_async_client_per_event_loop(self):
+        """Test that each event loop gets its own async client."""
+
+        async def fetch_twice():
+            client = get_async_client()
+            assert get_async_client() is client
+            await aclose_async_client()
+            return client
+
+        first = asyncio.run(fetch_twice())
+        second = asyncio.run(fetch_twice())
+        assert first is not second
+        assert first.is_closed
+        assert second.is_closed
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """Build the MCP server once; the tests below only inspect it."""
+    return create_mcp_server()
+
 
 class TestServerCreation:
     """Test server creation."""
 
-    def test_server_creation(self):
+    def test_server_creation(self, mcp_server):
         """Test that MCP server can be created."""
-        from macro_man.core.server import create_mcp_server
+        assert mcp_server is not None
+        assert hasattr(mcp_server, "run")
 
-        mcp = create_mcp_server()
-        assert mcp is not None
-        assert hasattr(mcp, "run")
-
-    def test_tool_registration(self):
+    def test_tool_registration(self, mcp_server):
         """Test that tools are registered."""
-        from macro_man.core.server import create_mcp_server
-
-        mcp = create_mcp_server()
-
         # We can't directly access the tools, but we can verify
         # that the server was created successfully
-        assert mcp is not None
+        assert mcp_server is not None
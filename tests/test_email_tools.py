@@ -1,21 +1,21 @@
 """Tests for email tools functionality."""
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import asyncio
+import gzip
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
-# Add src to Python path for testing
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 from macro_man.config.settings import get_settings
 from macro_man.tools.email import (
     _read_email_via_service,
     _send_email_via_service,
     read_email,
+    read_emails_batch,
     send_email,
+    send_email_async,
+    send_emails_bulk,
 )
 from macro_man.utils.exceptions import MacroManError, ValidationError
 
@@ -23,17 +23,20 @@ from macro_man.utils.exceptions import MacroManError, ValidationError
 class TestSendEmailViaService:
     """Test email sending via actual service."""
 
-    @patch("macro_man.tools.email.httpx.post")
-    def test_send_email_via_service_success(self, mock_post):
+    @patch("macro_man.tools.email.get_client")
+    def test_send_email_via_service_success(self, mock_client):
         """Test successful email sending via service."""
+        mock_post = mock_client.return_value.post
         # Mock successful response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "Email sent successfully",
-            "messageId": "<test-message-id@gmail.com>",
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "success": True,
+                "message": "Email sent successfully",
+                "messageId": "<test-message-id@gmail.com>",
+            }
+        )
         mock_post.return_value = mock_response
 
         result = _send_email_via_service(
@@ -45,26 +48,26 @@ class TestSendEmailViaService:
         assert result["messageId"] == "<test-message-id@gmail.com>"
 
         # Verify the HTTP call was made correctly
-        settings = get_settings()
-        expected_url = f"{settings.email_service_url}/send-email"
         mock_post.assert_called_once_with(
-            expected_url,
-            json={
-                "to": "test@example.com",
-                "subject": "Test Subject",
-                "body": "Test Body",
-            },
+            "/send-email",
+            content=orjson.dumps(
+                {
+                    "to": "test@example.com",
+                    "subject": "Test Subject",
+                    "body": "Test Body",
+                }
+            ),
             headers={"Content-Type": "application/json"},
-            timeout=30.0,
         )
 
-    @patch("macro_man.tools.email.httpx.post")
-    def test_send_email_via_service_http_error(self, mock_post):
+    @patch("macro_man.tools.email.get_client")
+    def test_send_email_via_service_http_error(self, mock_client):
         """Test email service HTTP error handling."""
+        mock_post = mock_client.return_value.post
         # Mock HTTP error response
         mock_response = MagicMock()
         mock_response.status_code = 500
-        mock_response.json.return_value = {"message": "Internal server error"}
+        mock_response.content = orjson.dumps({"message": "Internal server error"})
         mock_post.return_value = mock_response
 
         with pytest.raises(MacroManError) as exc_info:
@@ -73,9 +76,24 @@ class TestSendEmailViaService:
         assert "Email service returned status 500" in str(exc_info.value)
         assert "Internal server error" in str(exc_info.value)
 
-    @patch("macro_man.tools.email.httpx.post")
-    def test_send_email_via_service_connection_error(self, mock_post):
+    @patch("macro_man.tools.email.get_client")
+    def test_send_email_via_service_non_json_error(self, mock_client):
+        """Test that a non-JSON error body is reported as text."""
+        mock_post = mock_client.return_value.post
+        mock_response = MagicMock()
+        mock_response.status_code = 503
+        mock_response.content = b"Service Unavailable"
+        mock_post.return_value = mock_response
+
+        with pytest.raises(MacroManError) as exc_info:
+            _send_email_via_service("test@example.com", "Test", "Body")
+
+        assert "returned status 503: Service Unavailable" in str(exc_info.value)
+
+    @patch("macro_man.tools.email.get_client")
+    def test_send_email_via_service_connection_error(self, mock_client):
         """Test email service connection error handling."""
+        mock_post = mock_client.return_value.post
         # Mock connection error
         import httpx
 
@@ -86,9 +104,10 @@ class TestSendEmailViaService:
 
         assert "Could not connect to email service" in str(exc_info.value)
 
-    @patch("macro_man.tools.email.httpx.post")
-    def test_send_email_via_service_timeout(self, mock_post):
+    @patch("macro_man.tools.email.get_client")
+    def test_send_email_via_service_timeout(self, mock_client):
         """Test email service timeout handling."""
+        mock_post = mock_client.return_value.post
         # Mock timeout error
         import httpx
 
@@ -99,9 +118,10 @@ class TestSendEmailViaService:
 
         assert "Email service request timed out" in str(exc_info.value)
 
-    @patch("macro_man.tools.email.httpx.post")
-    def test_send_email_via_service_request_error(self, mock_post):
+    @patch("macro_man.tools.email.get_client")
+    def test_send_email_via_service_request_error(self, mock_client):
         """Test email service request error handling."""
+        mock_post = mock_client.return_value.post
         # Mock request error
         import httpx
 
@@ -112,6 +132,54 @@ class TestSendEmailViaService:
 
         assert "Email service request failed" in str(exc_info.value)
 
+    @patch("macro_man.tools.email._compress_requests", return_value=True)
+    @patch("macro_man.tools.email.get_client")
+    def test_send_email_via_service_compresses_large_body(
+        self, mock_client, mock_compress
+    ):
+        """Test that large bodies are gzipped when compression is enabled."""
+        mock_post = mock_client.return_value.post
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"success": True})
+        mock_post.return_value = mock_response
+
+        body = "Body text. " * 200
+        _send_email_via_service("test@example.com", "Test", body)
+
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["headers"] == {
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+        }
+        assert orjson.loads(gzip.decompress(kwargs["content"])) == {
+            "to": "test@example.com",
+            "subject": "Test",
+            "body": body,
+        }
+
+    @patch("macro_man.tools.email._compress_requests", return_value=True)
+    @patch("macro_man.tools.email.get_client")
+    def test_send_email_via_service_small_body_not_compressed(
+        self, mock_client, mock_compress
+    ):
+        """Test that small bodies are sent as plain JSON even with compression."""
+        mock_post = mock_client.return_value.post
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"success": True})
+        mock_post.return_value = mock_response
+
+        _send_email_via_service("test@example.com", "Test", "Body")
+
+        mock_post.assert_called_once_with(
+            "/send-email",
+            content=orjson.dumps(
+                {"to": "test@example.com", "subject": "Test", "body": "Body"}
+            ),
+            headers={"Content-Type": "application/json"},
+        )
+
 
 class TestSendEmail:
     """Test email sending functionality."""
@@ -258,32 +326,114 @@ class TestEmailToolsIntegration:
             send_email("invalid-email", "Subject", "Body")
 
 
+class TestSendEmailAsync:
+    """Test the async email sending path."""
+
+    @patch("macro_man.tools.email.get_async_client")
+    def test_send_email_async_success(self, mock_async_client):
+        """Test that the async path posts through the async client."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"success": True, "messageId": "<id>"})
+        mock_post = AsyncMock(return_value=mock_response)
+        mock_async_client.return_value.post = mock_post
+
+        result = asyncio.run(send_email_async(" test@example.com ", "Subject", "Body"))
+
+        assert result["success"] is True
+        assert result["recipient"] == "test@example.com"
+        mock_post.assert_awaited_once_with(
+            "/send-email",
+            content=orjson.dumps(
+                {"to": "test@example.com", "subject": "Subject", "body": "Body"}
+            ),
+            headers={"Content-Type": "application/json"},
+        )
+
+    @patch("macro_man.tools.email._send_email_via_service_async")
+    def test_send_emails_bulk(self, mock_service):
+        """Test that bulk sending returns results in input order."""
+
+        async def fake_send(to, subject, body):
+            return {"success": True, "messageId": f"<{to}>"}
+
+        mock_service.side_effect = fake_send
+
+        results = asyncio.run(
+            send_emails_bulk(
+                [
+                    ("a@example.com", "Hi", "Body A"),
+                    ("b@example.com", "Hi", "Body B"),
+                ]
+            )
+        )
+
+        assert [r["recipient"] for r in results] == ["a@example.com", "b@example.com"]
+        assert results[1]["messageId"] == "<b@example.com>"
+
+    @patch("macro_man.tools.email._send_email_via_service_async")
+    def test_send_emails_bulk_reports_failures_per_email(self, mock_service):
+        """Test that one failed send is reported without hiding the others."""
+
+        async def fake_send(to, subject, body):
+            if to == "b@example.com":
+                raise MacroManError("Email service returned status 500")
+            return {"success": True, "messageId": f"<{to}>"}
+
+        mock_service.side_effect = fake_send
+
+        results = asyncio.run(
+            send_emails_bulk(
+                [
+                    ("a@example.com", "Hi", "Body A"),
+                    ("b@example.com", "Hi", "Body B"),
+                    ("invalid-email", "Hi", "Body C"),
+                ]
+            )
+        )
+
+        assert [r["success"] for r in results] == [True, False, False]
+        assert results[0]["messageId"] == "<a@example.com>"
+        assert results[1]["recipient"] == "b@example.com"
+        assert "status 500" in results[1]["error"]
+        assert results[2]["recipient"] == "invalid-email"
+        assert mock_service.call_count == 2
+
+    def test_send_email_async_validation(self):
+        """Test that async sending validates inputs before any request."""
+        with pytest.raises(ValidationError):
+            asyncio.run(send_email_async("invalid-email", "Subject", "Body"))
+
+
 class TestReadEmailViaService:
     """Test reading emails via actual service."""
 
-    @patch("macro_man.tools.email.httpx.post")
-    def test_read_email_via_service_success(self, mock_post):
+    @patch("macro_man.tools.email.get_client")
+    def test_read_email_via_service_success(self, mock_client):
         """Test successful email read via service."""
+        mock_post = mock_client.return_value.post
         # Mock successful response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "query": 'in:anywhere "Alice" subject:"Hi" after:2025/10/01',
-            "total": 1,
-            "emails": [
-                {
-                    "id": "abc",
-                    "threadId": "t1",
-                    "snippet": "Hello",
-                    "from": "Alice <alice@example.com>",
-                    "to": "You <you@example.com>",
-                    "subject": "Hi",
-                    "date": "Sun, 19 Oct 2025 19:15:19 +0100",
-                    "body": "Hello world",
-                }
-            ],
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "success": True,
+                "query": 'in:anywhere "Alice" subject:"Hi" after:2025/10/01',
+                "total": 1,
+                "emails": [
+                    {
+                        "id": "abc",
+                        "threadId": "t1",
+                        "snippet": "Hello",
+                        "from": "Alice <alice@example.com>",
+                        "to": "You <you@example.com>",
+                        "subject": "Hi",
+                        "date": "Sun, 19 Oct 2025 19:15:19 +0100",
+                        "body": "Hello world",
+                    }
+                ],
+            }
+        )
         mock_post.return_value = mock_response
 
         payload = {
@@ -300,21 +450,15 @@ class TestReadEmailViaService:
         assert result["total"] == 1
 
         # Verify HTTP call
-        settings = get_settings()
-        expected_url = f"{settings.email_service_url}/read-email"
-        mock_post.assert_called_once()
-        called_args, called_kwargs = mock_post.call_args
-        assert called_args[0] == expected_url
-        assert called_kwargs["json"] == payload
-        assert called_kwargs["headers"] == {"Content-Type": "application/json"}
-        assert called_kwargs["timeout"] == 30.0
-
-    @patch("macro_man.tools.email.httpx.post")
-    def test_read_email_via_service_http_error(self, mock_post):
+        mock_post.assert_called_once_with("/read-email", json=payload)
+
+    @patch("macro_man.tools.email.get_client")
+    def test_read_email_via_service_http_error(self, mock_client):
         """Test HTTP error handling for read service."""
+        mock_post = mock_client.return_value.post
         mock_response = MagicMock()
         mock_response.status_code = 502
-        mock_response.json.return_value = {"message": "Bad gateway"}
+        mock_response.content = orjson.dumps({"message": "Bad gateway"})
         mock_post.return_value = mock_response
 
         with pytest.raises(MacroManError) as exc:
@@ -323,8 +467,9 @@ class TestReadEmailViaService:
         assert "returned status 502" in str(exc.value)
         assert "Bad gateway" in str(exc.value)
 
-    @patch("macro_man.tools.email.httpx.post")
-    def test_read_email_via_service_connection_error(self, mock_post):
+    @patch("macro_man.tools.email.get_client")
+    def test_read_email_via_service_connection_error(self, mock_client):
+        mock_post = mock_client.return_value.post
         import httpx
 
         mock_post.side_effect = httpx.ConnectError("Connection failed")
@@ -334,8 +479,9 @@ class TestReadEmailViaService:
 
         assert "Could not connect to email service" in str(exc.value)
 
-    @patch("macro_man.tools.email.httpx.post")
-    def test_read_email_via_service_timeout(self, mock_post):
+    @patch("macro_man.tools.email.get_client")
+    def test_read_email_via_service_timeout(self, mock_client):
+        mock_post = mock_client.return_value.post
         import httpx
 
         mock_post.side_effect = httpx.TimeoutException("Request timed out")
@@ -345,8 +491,9 @@ class TestReadEmailViaService:
 
         assert "request timed out" in str(exc.value).lower()
 
-    @patch("macro_man.tools.email.httpx.post")
-    def test_read_email_via_service_request_error(self, mock_post):
+    @patch("macro_man.tools.email.get_client")
+    def test_read_email_via_service_request_error(self, mock_client):
+        mock_post = mock_client.return_value.post
         import httpx
 
         mock_post.side_effect = httpx.RequestError("Request failed")
@@ -405,3 +552,84 @@ class TestReadEmail:
         with pytest.raises(ValidationError) as exc:
             read_email(maxResults=0)
         assert getattr(exc.value, "field", None) == "maxResults"
+
+
+class TestReadEmailsBatch:
+    """Test batched email reads."""
+
+    @pytest.fixture(autouse=True)
+    def _batch_read_enabled(self, monkeypatch):
+        """Enable batch reads, which are off by default."""
+        monkeypatch.setattr(get_settings(), "email_batch_read", True)
+
+    @staticmethod
+    def _response(status_code, body):
+        response = MagicMock()
+        response.status_code = status_code
+        response.content = orjson.dumps(body)
+        return response
+
+    @patch("macro_man.tools.email.get_async_client")
+    def test_read_emails_batch_chunks_ids(self, mock_async_client):
+        """Test that IDs are sent in chunks of 100."""
+        ids = [f"id{i}" for i in range(150)]
+        mock_post = AsyncMock(
+            side_effect=[
+                self._response(200, {"emails": [{"id": i} for i in ids[:100]]}),
+                self._response(200, {"emails": [{"id": i} for i in ids[100:]]}),
+            ]
+        )
+        mock_async_client.return_value.post = mock_post
+
+        emails = asyncio.run(read_emails_batch(ids))
+
+        assert emails == [{"id": i} for i in ids]
+        assert mock_post.await_count == 2
+        first_payload = mock_post.await_args_list[0].kwargs["json"]
+        assert first_payload["ids"] == ids[:100]
+        assert first_payload["includeBody"] is True
+
+    @patch("macro_man.tools.email.get_async_client")
+    def test_read_emails_batch_falls_back_to_single_reads(self, mock_async_client):
+        """Test per-ID reads when the service lacks batch support."""
+        mock_post = AsyncMock(
+            side_effect=[
+                self._response(404, {"message": "Not found"}),
+                self._response(200, {"emails": [{"id": "a"}]}),
+                self._response(200, {"emails": [{"id": "b"}]}),
+            ]
+        )
+        mock_async_client.return_value.post = mock_post
+
+        emails = asyncio.run(read_emails_batch(["a", "b"], includeBody=False))
+
+        assert emails == [{"id": "a"}, {"id": "b"}]
+        assert mock_post.await_args_list[1].kwargs["json"] == {
+            "id": "a",
+            "includeBody": False,
+        }
+
+    @patch("macro_man.tools.email.get_async_client")
+    def test_read_emails_batch_rejects_unrequested_emails(self, mock_async_client):
+        """Test that a reply ignoring the ids filter isn't returned as the batch."""
+        mock_async_client.return_value.post = AsyncMock(
+            return_value=self._response(200, {"emails": [{"id": "x"}, {"id": "y"}]})
+        )
+
+        with pytest.raises(MacroManError) as exc:
+            asyncio.run(read_emails_batch(["a", "b"]))
+        assert "did not return the requested emails" in str(exc.value)
+
+    def test_read_emails_batch_disabled_by_default(self, monkeypatch):
+        """Test that batch reads fail fast unless enabled in settings."""
+        monkeypatch.setattr(get_settings(), "email_batch_read", False)
+
+        with pytest.raises(MacroManError) as exc:
+            asyncio.run(read_emails_batch(["a"]))
+        assert "EMAIL_BATCH_READ" in str(exc.value)
+
+    def test_read_emails_batch_invalid_ids(self):
+        """Test that empty ID lists are rejected."""
+        with pytest.raises(ValidationError) as exc:
+            asyncio.run(read_emails_batch([]))
+        assert exc.value.field == "ids"
@@ -1,21 +1,18 @@
 """Tests for file operation tools."""
 
 import json
+import math
 import os
-import sys
 import tempfile
-from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
-# Add src to Python path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 from macro_man.tools.file_ops import (
     list_directory,
     read_file,
     read_json_file,
+    register_file_tools,
     write_file,
     write_json_file,
 )
@@ -111,6 +108,16 @@ class TestWriteFile:
         finally:
             os.unlink(temp_path)
 
+    def test_write_new_file_with_overwrite(self):
+        """Test that overwrite=True on a new file doesn't report an overwrite."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "new_file.txt")
+
+            result = write_file(temp_path, "content", overwrite=True)
+
+            assert result["success"] is True
+            assert result["overwritten"] is False
+
     def test_write_file_without_overwrite_existing(self):
         """Test writing to existing file without overwrite raises ValidationError."""
         with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
@@ -145,6 +152,16 @@ class TestWriteFile:
 class TestListDirectory:
     """Test list_directory function."""
 
+    def test_list_default_directory_paths(self, tmp_path, monkeypatch):
+        """Test that listing "." reports paths without a "./" prefix."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "sub").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        result = list_directory()
+
+        assert [item["path"] for item in result] == ["a.txt", "sub"]
+
     def test_list_existing_directory(self):
         """Test listing an existing directory."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -230,6 +247,29 @@ class TestListDirectory:
             assert "visible.txt" in result_names
             assert ".hidden.txt" in result_names
 
+    def test_list_directory_with_limit_and_offset(self):
+        """Test paging through a directory listing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("a.txt", "b.txt", "c.txt", "d.txt"):
+                with open(os.path.join(temp_dir, name), "w") as f:
+                    f.write(name)
+
+            first = list_directory(temp_dir, limit=3)
+            rest = list_directory(temp_dir, limit=3, offset=3)
+
+            assert [item["name"] for item in first] == ["a.txt", "b.txt", "c.txt"]
+            assert [item["name"] for item in rest] == ["d.txt"]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "field"), [({"limit": 0}, "limit"), ({"offset": -1}, "offset")]
+    )
+    def test_list_directory_invalid_paging(self, kwargs, field):
+        """Test that invalid limit/offset values raise ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            list_directory(".", **kwargs)
+
+        assert exc_info.value.field == field
+
     def test_list_directory_default_path(self):
         """Test listing directory with default path (current directory)."""
         result = list_directory()
@@ -326,12 +366,47 @@ class TestWriteJsonFile:
             result = write_json_file(temp_path, test_data)
 
             assert result["success"] is True
+            assert result["size"] == os.path.getsize(temp_path)
 
             # Verify file was created and contains correct unicode
             with open(temp_path, encoding="utf-8") as f:
                 loaded_data = json.load(f)
                 assert loaded_data == test_data
 
+    def test_write_json_file_with_non_string_keys(self):
+        """Test that non-string keys are written as strings, like json.dumps."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "test.json")
+
+            write_json_file(temp_path, {1: "one", "two": 2})
+
+            with open(temp_path, encoding="utf-8") as f:
+                assert json.load(f) == {"1": "one", "two": 2}
+
+    @pytest.mark.parametrize(
+        "value",
+        [float("inf"), float("-inf"), 2**70, -(2**70), [1, {"big": 2**64}]],
+    )
+    def test_write_json_file_round_trips_values_orjson_cannot(self, value):
+        """Test that infinities and integers beyond 64 bits round-trip exactly."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "test.json")
+
+            write_json_file(temp_path, {"value": value})
+
+            assert read_json_file(temp_path) == {"value": value}
+
+    def test_write_json_file_round_trips_nan(self):
+        """Test that NaN is written as NaN rather than null."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "test.json")
+
+            write_json_file(temp_path, {"values": [1.5, float("nan")]})
+
+            values = read_json_file(temp_path)["values"]
+            assert values[0] == 1.5
+            assert math.isnan(values[1])
+
     def test_write_json_file_existing_without_overwrite(self):
         """Test writing JSON file to existing file without overwrite raises ValidationError."""
         with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
@@ -345,3 +420,32 @@ class TestWriteJsonFile:
             assert "File already exists" in str(exc_info.value)
         finally:
             os.unlink(temp_path)
+
+
+class TestRegisterFileTools:
+    """Test file tool registration."""
+
+    def test_register_file_tools(self):
+        """Test that the module-level functions are registered by tool name."""
+        mock_server = MagicMock()
+
+        register_file_tools(mock_server)
+
+        names = [call.kwargs["name"] for call in mock_server.tool.call_args_list]
+        assert names == [
+            "_read_file",
+            "_write_file",
+            "_list_directory",
+            "_read_json_file",
+            "_write_json_file",
+        ]
+        registered = [
+            call.args[0] for call in mock_server.tool.return_value.call_args_list
+        ]
+        assert registered == [
+            read_file,
+            write_file,
+            list_directory,
+            read_json_file,
+            write_json_file,
+        ]
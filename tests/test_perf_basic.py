@@ -0,0 +1,42 @@
+"""Micro-benchmarks for hot tool paths.
+
+Skipped by default (``--benchmark-skip`` in the pytest addopts). Run with
+``python -m pytest tests/test_perf_basic.py --benchmark-only -n 0``.
+"""
+
+import macro_man.tools.basic as basic_module
+from macro_man.tools.calendar import _list_events_payload, _schedule_meet_payload
+
+
+def test_system_info_perf(benchmark):
+    """Benchmark get_system_info, whose platform lookups are cached."""
+    info = benchmark(basic_module.get_system_info)
+    assert "platform" in info
+    assert "timestamp" in info
+
+
+def test_schedule_meet_payload_perf(benchmark):
+    """Benchmark validating and building a schedule_meet payload."""
+    payload = benchmark(
+        _schedule_meet_payload,
+        title="Design sync",
+        description="Review MCP server changes",
+        start="2025-10-21T10:00:00Z",
+        end="2025-10-21T10:30:00Z",
+        timeZone="UTC",
+        attendees=["user@example.com", "other@example.com"],
+        sendUpdates="all",
+    )
+    assert payload["attendees"] == ["user@example.com", "other@example.com"]
+
+
+def test_list_events_payload_perf(benchmark):
+    """Benchmark validating and building a list_events payload."""
+    payload = benchmark(
+        _list_events_payload,
+        timeMin="2025-10-20T00:00:00Z",
+        timeMax="2025-10-27T23:59:59Z",
+        maxResults=10,
+        q="meeting",
+    )
+    assert payload["maxResults"] == 10
@@ -1,19 +1,12 @@
 """Additional coverage tests for MCP server module."""
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
-
-import pytest
-
-# Add src to Python path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 import builtins
 import contextlib
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from macro_man.core.server import create_mcp_server, run_server
+import pytest
+
+from macro_man.core.server import create_mcp_server, run_server, serve
 
 
 class TestCreateMCPServer:
@@ -95,7 +88,7 @@ class TestRunServer:
         mock_create.return_value = mock_mcp
 
         # Mock the run method to simulate server execution
-        mock_mcp.run.side_effect = KeyboardInterrupt()
+        mock_mcp.run_streamable_http_async = AsyncMock(side_effect=KeyboardInterrupt())
 
         # Running server should not raise exception
         with contextlib.suppress(KeyboardInterrupt):
@@ -106,7 +99,7 @@ class TestRunServer:
         """Test server handles KeyboardInterrupt gracefully."""
         mock_mcp = MagicMock()
         mock_create.return_value = mock_mcp
-        mock_mcp.run.side_effect = KeyboardInterrupt()
+        mock_mcp.run_streamable_http_async = AsyncMock(side_effect=KeyboardInterrupt())
 
         # Should handle keyboard interrupt without raising
         with (
@@ -123,7 +116,7 @@ class TestRunServer:
 
         # Simulate a generic exception during server run
         test_error = RuntimeError("Test error")
-        mock_mcp.run.side_effect = test_error
+        mock_mcp.run_streamable_http_async = AsyncMock(side_effect=test_error)
 
         # Should raise the exception after logging
         with patch("macro_man.core.server.logger") as mock_logger:
@@ -140,7 +133,7 @@ class TestRunServer:
         mock_create.return_value = mock_mcp
 
         # Force an exception
-        mock_mcp.run.side_effect = Exception("Test")
+        mock_mcp.run_streamable_http_async = AsyncMock(side_effect=Exception("Test"))
 
         with patch("macro_man.core.server.logger") as mock_logger:
             with contextlib.suppress(Exception):
@@ -158,7 +151,7 @@ class TestRunServer:
         mock_create.return_value = mock_mcp
 
         # Make run succeed by not raising exception
-        mock_mcp.run.return_value = None
+        mock_mcp.run_streamable_http_async = AsyncMock(return_value=None)
 
         with patch("macro_man.core.server.logger") as mock_logger:
             with contextlib.suppress(builtins.BaseException):
@@ -203,3 +196,30 @@ class TestServerIntegration:
         # All servers should be created successfully
         assert all(s is not None for s in servers)
         assert all(hasattr(s, "run") for s in servers)
+
+
+class TestServe:
+    """Test running the server on a transport."""
+
+    @pytest.mark.parametrize(
+        ("transport", "runner"),
+        [
+            ("stdio", "run_stdio_async"),
+            ("streamable-http", "run_streamable_http_async"),
+        ],
+    )
+    def test_serve_closes_async_client(self, transport, runner):
+        """Test that the async service client is closed when the server stops."""
+        mock_mcp = MagicMock()
+        setattr(mock_mcp, runner, AsyncMock(side_effect=RuntimeError("stop")))
+
+        with (
+            patch(
+                "macro_man.core.server.aclose_async_client", new_callable=AsyncMock
+            ) as mock_close,
+            pytest.raises(RuntimeError),
+        ):
+            serve(mock_mcp, transport)
+
+        getattr(mock_mcp, runner).assert_awaited_once()
+        mock_close.assert_awaited_once()
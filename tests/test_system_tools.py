@@ -2,17 +2,10 @@
 
 import os
 import subprocess
-import sys
-
-# Add src to Python path
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 from macro_man.tools.system import (
     execute_command,
     get_environment_variables,
@@ -195,7 +188,7 @@ class TestExecuteCommand:
         assert result["return_code"] == 0
         assert result["success"] is True
 
-    @patch("subprocess.run")
+    @patch("macro_man.tools.system._run_bounded")
     def test_execute_command_timeout_exception(self, mock_run):
         """Test command timeout raises MacroManError."""
         mock_run.side_effect = subprocess.TimeoutExpired("test", 30)
@@ -253,7 +246,7 @@ class TestGetPythonInfo:
 
     def test_get_python_info(self):
         """Test getting Python runtime information."""
-        result = get_python_info()
+        result = get_python_info(include_path=True)
 
         assert isinstance(result, dict)
         assert "version" in result
@@ -1,17 +1,15 @@
 """Additional coverage tests for system tools module."""
 
 import os
+import subprocess
 import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add src to Python path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 from macro_man.tools.system import (
+    _cpu_percent,
+    _current_process,
     execute_command,
     get_environment_variables,
     get_process_info,
@@ -22,6 +20,19 @@ from macro_man.tools.system import (
 from macro_man.utils.exceptions import MacroManError, ValidationError
 
 
+class TestLazyPsutilImport:
+    """Test that psutil is only imported once a system tool needs it."""
+
+    def test_import_does_not_load_psutil(self):
+        """Test that importing the system tools module doesn't import psutil."""
+        code = "import sys, macro_man.tools.system; print('psutil' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+
 class TestGetProcessInfoCoverage:
     """Additional tests for get_process_info coverage."""
 
@@ -60,6 +71,13 @@ class TestGetProcessInfoCoverage:
         assert result["memory_info"]["vms"] == 209715200
         assert isinstance(result["create_time"], str)
         assert result["num_threads"] == 5
+        mock_process.oneshot.assert_called_once_with()
+        mock_process.memory_info.assert_called_once_with()
+
+    def test_current_process_is_reused(self):
+        """Test that the current process handle is created once and reused."""
+        assert _current_process(os.getpid()) is _current_process(os.getpid())
+        assert get_process_info()["pid"] == os.getpid()
 
     def test_get_current_process_info_timestamp_format(self):
         """Test that current process info includes valid ISO timestamp."""
@@ -74,6 +92,33 @@ class TestGetProcessInfoCoverage:
 class TestGetSystemStatsCoverage:
     """Additional tests for get_system_stats coverage."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_stats(self):
+        """Make each test read the (patched) counters instead of the cache."""
+        with patch.dict("macro_man.tools.system._stats_cache", clear=True):
+            yield
+
+    def test_system_stats_cached_within_ttl(self):
+        """Test that repeated calls within the TTL return the cached result."""
+        first = get_system_stats()
+
+        with patch("psutil.virtual_memory") as mock_virtual_memory:
+            assert get_system_stats() == first
+
+        mock_virtual_memory.assert_not_called()
+
+    def test_system_stats_cached_result_isolated(self):
+        """Test that mutating a returned result doesn't change the cache."""
+        first = get_system_stats()
+        expected_total = first["memory"]["total"]
+        first["memory"]["total"] = -1
+        del first["cpu"]
+
+        second = get_system_stats()
+        assert second["memory"]["total"] == expected_total
+        assert "cpu" in second
+        assert second["timestamp"] == first["timestamp"]
+
     @patch("psutil.cpu_freq")
     def test_system_stats_with_none_cpu_freq(self, mock_cpu_freq):
         """Test system stats when cpu_freq returns None."""
@@ -147,6 +192,34 @@ class TestGetSystemStatsCoverage:
         assert network["packets_sent"] == 10000
         assert network["packets_recv"] == 50000
 
+    @patch("psutil.net_io_counters")
+    @patch("psutil.disk_usage")
+    def test_system_stats_selected_fields(self, mock_disk_usage, mock_net_io):
+        """Test that only the requested sections are collected."""
+        result = get_system_stats(fields=["memory", "cpu"])
+
+        assert list(result) == ["timestamp", "cpu", "memory"]
+        mock_disk_usage.assert_not_called()
+        mock_net_io.assert_not_called()
+
+    def test_system_stats_unknown_field(self):
+        """Test that unknown section names raise ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            get_system_stats(fields=["cpu", "gpu"])
+
+        assert "gpu" in str(exc_info.value)
+        assert exc_info.value.field == "fields"
+
+    @patch("psutil.cpu_percent", return_value=42.0)
+    def test_cpu_percent_samples_without_blocking(self, mock_cpu_percent):
+        """Test that CPU usage is sampled without an interval, at most every 0.1s."""
+        with patch.dict("macro_man.tools.system._cpu_sample", {"time": 0.0}):
+            assert _cpu_percent() == 42.0
+            # A second call straight away reuses the previous sample
+            assert _cpu_percent() == 42.0
+
+        mock_cpu_percent.assert_called_once_with(interval=None)
+
     @patch("psutil.virtual_memory")
     def test_system_stats_exception_handling(self, mock_virtual_memory):
         """Test system stats handles exceptions properly."""
@@ -158,6 +231,16 @@ class TestGetSystemStatsCoverage:
         assert "Failed to get system stats" in str(exc_info.value)
 
 
+# Successful _run_bounded result with no output
+_OUTPUT = {
+    "return_code": 0,
+    "stdout": "",
+    "stderr": "",
+    "stdout_truncated": False,
+    "stderr_truncated": False,
+}
+
+
 class TestExecuteCommandCoverage:
     """Additional tests for execute_command coverage."""
 
@@ -178,6 +261,16 @@ class TestExecuteCommandCoverage:
             # Should have logged
             assert mock_logger.info.called
 
+    def test_execute_command_result_log_omits_output(self):
+        """Test that the completion log record doesn't carry the output."""
+        with patch("macro_man.tools.system.logger") as mock_logger:
+            execute_command("echo test")
+
+        kwargs = mock_logger.debug.call_args.kwargs
+        assert kwargs["return_code"] == 0
+        assert "stdout" not in kwargs
+        assert "stderr" not in kwargs
+
     @patch("subprocess.run")
     def test_execute_command_logs_on_dangerous_attempt(self, mock_run):
         """Test that dangerous command attempt is logged."""
@@ -201,14 +294,18 @@ class TestExecuteCommandCoverage:
             with pytest.raises(ValidationError):
                 execute_command(cmd)
 
-    @patch("subprocess.run")
+    @patch("macro_man.tools.system._run_bounded", return_value=_OUTPUT)
+    def test_execute_command_allows_su_inside_words(self, mock_run):
+        """Test that "su" inside a longer word isn't treated as dangerous."""
+
+        result = execute_command("echo result summary")
+
+        assert result["success"] is True
+
+    @patch("macro_man.tools.system._run_bounded")
     def test_execute_command_capture_output(self, mock_run):
         """Test that command output is captured correctly."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="Output text",
-            stderr="",
-        )
+        mock_run.return_value = {**_OUTPUT, "stdout": "Output text"}
 
         result = execute_command("test command")
 
@@ -224,25 +321,87 @@ class TestExecuteCommandCoverage:
             result = execute_command("echo test", timeout=timeout_val)
             assert result["success"] is True
 
-    @patch("subprocess.run")
-    def test_execute_command_shell_true(self, mock_run):
-        """Test that subprocess is called with shell=True."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+    @patch("macro_man.tools.system._run_bounded", return_value=_OUTPUT)
+    def test_execute_command_without_shell(self, mock_run):
+        """Test that commands are split and run without a shell by default."""
+        execute_command("echo 'hello world'")
 
-        execute_command("echo test")
+        mock_run.assert_called_once_with(["echo", "hello world"], False, 30)
 
-        # Verify shell=True was passed
-        assert mock_run.call_args.kwargs["shell"] is True
+    @patch("macro_man.tools.system._run_bounded", return_value=_OUTPUT)
+    def test_execute_command_use_shell(self, mock_run):
+        """Test that use_shell=True passes the command string to the shell."""
+        execute_command("echo test | cat", use_shell=True)
 
-    @patch("subprocess.run")
-    def test_execute_command_text_true(self, mock_run):
-        """Test that subprocess is called with text=True."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.assert_called_once_with("echo test | cat", True, 30)
 
-        execute_command("echo test")
+    def test_execute_command_shell_pipeline(self):
+        """Test that pipes work when running through the shell."""
+        result = execute_command("echo piped | cat", use_shell=True)
+
+        assert result["success"] is True
+        assert result["stdout"].strip() == "piped"
+
+    def test_execute_command_not_found(self):
+        """Test that a missing program is reported like a shell would."""
+        result = execute_command("definitely-not-a-real-command-xyz")
+
+        assert result["return_code"] == 127
+        assert result["success"] is False
+        assert (
+            result["stderr"] == "definitely-not-a-real-command-xyz: command not found"
+        )
+
+    def test_execute_command_shell_file_not_found_not_masked(self):
+        """Test that a FileNotFoundError in shell mode isn't reported as 127."""
+        with (
+            patch(
+                "macro_man.tools.system._run_bounded",
+                side_effect=FileNotFoundError(2, "No such file", "/bin/sh"),
+            ),
+            pytest.raises(MacroManError),
+        ):
+            execute_command("echo hi", use_shell=True)
+
+    def test_execute_command_shell_missing_program(self):
+        """Test that the shell reports a missing program itself."""
+        result = execute_command(
+            "definitely-not-a-real-command-xyz --flag", use_shell=True
+        )
 
-        # Verify text=True was passed
-        assert mock_run.call_args.kwargs["text"] is True
+        assert result["return_code"] == 127
+        assert "definitely-not-a-real-command-xyz" in result["stderr"]
+
+    def test_execute_command_unbalanced_quotes(self):
+        """Test that a command shlex can't parse raises ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            execute_command("echo 'unterminated")
+
+        assert exc_info.value.field == "command"
+
+    def test_execute_command_decodes_output(self):
+        """Test that captured output is returned as text."""
+        result = execute_command("echo héllo")
+
+        assert result["stdout"] == "héllo\n"
+        assert result["stdout_truncated"] is False
+        assert result["stderr_truncated"] is False
+
+    def test_execute_command_kills_on_timeout(self):
+        """Test that a command running past its timeout is killed."""
+        with pytest.raises(MacroManError) as exc_info:
+            execute_command("sleep 10", timeout=1)
+
+        assert "Command timed out after 1 seconds" in str(exc_info.value)
+
+    @patch("macro_man.tools.system._MAX_OUTPUT_BYTES", 1000)
+    def test_execute_command_truncates_large_output(self):
+        """Test that runaway output is cut off and the command killed."""
+        result = execute_command("yes")
+
+        assert len(result["stdout"]) == 1000
+        assert result["stdout_truncated"] is True
+        assert result["success"] is False
 
 
 class TestGetEnvironmentVariablesCoverage:
@@ -327,13 +486,18 @@ class TestGetPythonInfoCoverage:
 
     def test_get_python_info_path_list(self):
         """Test that Python path is a proper list."""
-        result = get_python_info()
+        result = get_python_info(include_path=True)
 
         path = result["path"]
         assert isinstance(path, list)
         assert len(path) > 0
-        # Should match sys.path
+        # Should match sys.path without aliasing it
         assert path == sys.path
+        assert path is not sys.path
+
+    def test_get_python_info_omits_path_by_default(self):
+        """Test that sys.path is only included when asked for."""
+        assert "path" not in get_python_info()
 
     def test_get_python_info_modules_count_reasonable(self):
         """Test that modules count is reasonable."""
@@ -343,6 +507,16 @@ class TestGetPythonInfoCoverage:
         assert result["modules_count"] >= 10
         assert result["modules_count"] == len(sys.modules)
 
+    def test_get_python_info_cached_result_isolated(self):
+        """Test that mutating a returned result doesn't change later results."""
+        first = get_python_info()
+        first["version_info"]["major"] = -1
+        first["version"] = "mutated"
+
+        second = get_python_info()
+        assert second["version_info"]["major"] == sys.version_info.major
+        assert second["version"] == sys.version
+
 
 class TestRegisterSystemTools:
     """Test tool registration function."""